@@ -1,5 +1,6 @@
 import os
 import psycopg2
+from psycopg2.extras import execute_values
 import logging
 from datetime import datetime
 from dotenv import load_dotenv
@@ -33,6 +34,77 @@ def log_error(error_message, player_url=None):
         if 'conn' in locals():
             conn.close()
 
+def get_known_player_urls(source):
+    """Return the set of player_urls already stored for a source.
+
+    Lets scrapers skip the network round-trip for players they have
+    already collected on a previous run. Returns an empty set on failure
+    so callers simply scrape everything.
+    """
+    try:
+        conn = psycopg2.connect(**db_params)
+        cur = conn.cursor()
+        cur.execute("""
+            SELECT player_url FROM players
+            WHERE source = %s AND player_url IS NOT NULL;
+        """, (source,))
+        return {row[0] for row in cur.fetchall()}
+    except psycopg2.Error as e:
+        logger.error(f"Failed to load known player URLs for {source}: {e}")
+        return set()
+    finally:
+        if 'cur' in locals():
+            cur.close()
+        if 'conn' in locals():
+            conn.close()
+
+def insert_players(rows):
+    """Insert a batch of player dicts in one transaction.
+
+    Returns the number of rows handed to the database (0 on failure). Rows
+    sharing a player_url are deduplicated, last one wins, because a single
+    INSERT ... ON CONFLICT cannot touch the same row twice.
+    """
+    if not rows:
+        return 0
+    deduped = {}
+    no_url = []
+    for row in rows:
+        if row['player_url']:
+            deduped[row['player_url']] = row
+        else:
+            no_url.append(row)
+    rows = list(deduped.values()) + no_url
+    try:
+        conn = psycopg2.connect(**db_params)
+        cur = conn.cursor()
+        execute_values(cur, """
+            INSERT INTO players (name, age, weight, height, country, position, team, source, player_url)
+            VALUES %s
+            ON CONFLICT (player_url) DO UPDATE SET
+                age = EXCLUDED.age,
+                weight = EXCLUDED.weight,
+                height = EXCLUDED.height,
+                country = EXCLUDED.country,
+                position = EXCLUDED.position,
+                team = EXCLUDED.team,
+                updated_at = CURRENT_TIMESTAMP;
+        """, [
+            (row['name'], row['age'], row['weight'], row['height'], row['country'],
+             row['position'], row['team'], row['source'], row['player_url'])
+            for row in rows
+        ])
+        conn.commit()
+        return len(rows)
+    except Exception as e:
+        log_error(f"DB Error bulk inserting {len(rows)} players: {e}")
+        return 0
+    finally:
+        if 'cur' in locals():
+            cur.close()
+        if 'conn' in locals():
+            conn.close()
+
 def insert_player(data):
     try:
         conn = psycopg2.connect(**db_params)
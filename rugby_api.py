@@ -23,6 +23,7 @@ from basketasia import process_country, asia_countries
 from basketusa import process_country, us_teams
 from basketlatin import process_country, latin_countries
 import psycopg2
+from psycopg2 import pool as pg_pool
 import logging
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel
@@ -106,19 +107,38 @@ class ScrapingStatus(BaseModel):
     start_time: Optional[datetime] = None
     errors: List[str]
 
+# Connection pool - avoids a full TCP+auth roundtrip per insert/query
+_connection_pool = None
+
+def _get_pool():
+    global _connection_pool
+    if _connection_pool is None:
+        _connection_pool = pg_pool.ThreadedConnectionPool(minconn=1, maxconn=8, **db_params)
+    return _connection_pool
+
 # Database connection helper
 def get_db_connection():
     try:
-        conn = psycopg2.connect(**db_params)
-        return conn
+        return _get_pool().getconn()
     except psycopg2.Error as e:
         logger.error(f"Database connection failed: {e}")
         raise HTTPException(status_code=500, detail="Database connection failed")
 
+# Return a pooled connection instead of closing it. Roll back first so a
+# failed statement (or an uncommitted read transaction) can't leave the
+# connection aborted or idle-in-transaction for the next borrower.
+def put_db_connection(conn):
+    if conn is not None and _connection_pool is not None:
+        try:
+            conn.rollback()
+        except psycopg2.Error:
+            pass
+        _connection_pool.putconn(conn)
+
 # Initialize database tables
 def init_db():
     try:
-        conn = psycopg2.connect(**db_params)
+        conn = _get_pool().getconn()
         cur = conn.cursor()
         cur.execute("""
             CREATE TABLE IF NOT EXISTS players (
@@ -157,12 +177,12 @@ def init_db():
         if 'cur' in locals():
             cur.close()
         if 'conn' in locals():
-            conn.close()
+            put_db_connection(conn)
 
 # Log error to database
 def log_error(error_message, player_url=None):
     try:
-        conn = psycopg2.connect(**db_params)
+        conn = _get_pool().getconn()
         cur = conn.cursor()
         cur.execute("""
             INSERT INTO rugby_logs (error_message, player_url)
@@ -183,7 +203,24 @@ def log_error(error_message, player_url=None):
         if 'cur' in locals():
             cur.close()
         if 'conn' in locals():
-            conn.close()
+            put_db_connection(conn)
+
+# URL patterns blocked via CDP - we only need DOM text, so skip images/fonts/trackers
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff*", "*.ttf",
+    "*google-analytics*", "*googletagmanager*", "*doubleclick*", "*facebook.net*"
+]
+
+# Resolved once per process - ChromeDriverManager().install() hits the network
+# to check driver metadata on every call otherwise
+_chromedriver_path = None
+
+def get_chromedriver_path():
+    global _chromedriver_path
+    if _chromedriver_path is None:
+        _chromedriver_path = ChromeDriverManager().install()
+    return _chromedriver_path
 
 # Selenium setup
 def setup_driver():
@@ -193,7 +230,21 @@ def setup_driver():
     options.add_argument('--disable-dev-shm-usage')
     options.add_argument('--disable-gpu')
     options.add_argument('--window-size=1920,1080')
-    return webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+    driver = webdriver.Chrome(service=Service(get_chromedriver_path()), options=options)
+    # Block non-essential resources to cut page-load bytes
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    return driver
+
+# Combined bio pattern - one finditer pass over the bio text instead of four
+# separate re.search scans, dispatched on m.lastgroup
+_BIO_COMBINED_RE = re.compile(
+    r'[Ss]tanding at (?P<height>[0-9.]+) ?m'
+    r'|[Ww]eighing in at (?P<weight>\d+)'
+    r'|currently plays for (?P<team>.+?) in'
+    r'|(?P<country>[A-Z][a-z]+) rugby player'
+)
+_H1_RE = re.compile(r"(.+?)\s+(\d+)\s+years,\s+(.+)")
 
 # Extract player info from bio section
 def extract_from_bio(driver):
@@ -202,10 +253,15 @@ def extract_from_bio(driver):
         bio_section = container.find_element(By.CSS_SELECTOR, 'div.bio')
         bio_text = bio_section.text.strip()
 
+        found = {}
+        for m in _BIO_COMBINED_RE.finditer(bio_text):
+            key = m.lastgroup
+            if key not in found:
+                found[key] = m.group(key)
+
         # Convert height from meters to feet
-        height_match = re.search(r'[Ss]tanding at ([0-9.]+) ?m', bio_text)
-        if height_match:
-            height_m = float(height_match.group(1))
+        if found.get('height'):
+            height_m = float(found['height'])
             total_inches = int(round(height_m * 39.3701))  # 1 meter = 39.3701 inches
             feet = total_inches // 12
             inches = total_inches % 12
@@ -213,43 +269,51 @@ def extract_from_bio(driver):
         else:
             height = None
 
-        weight_match = re.search(r'[Ww]eighing in at (\d+)', bio_text)
-        weight = weight_match.group(1) if weight_match else None
-
-        team_match = re.search(r'currently plays for (.+?) in', bio_text)
-        team = team_match.group(1).strip() if team_match else None
-
-        country_match = re.search(r'([A-Z][a-z]+) rugby player', bio_text)
-        country = country_match.group(1).strip() if country_match else None
-
         return {
             'height': height,
-            'weight': weight,
-            'team': team,
-            'country': country
+            'weight': found.get('weight'),
+            'team': found['team'].strip() if found.get('team') else None,
+            'country': found['country'].strip() if found.get('country') else None
         }
     except Exception as e:
         logger.warning(f"Failed bio extraction: {e}")
         return {}
 
+# Server-side prepared upsert - PREPARE once per session so repeated inserts
+# skip SQL parse/plan on the server. PREPARE is per-connection, so EXECUTE
+# first and prepare on the miss; tracking connections by id() had no way to
+# notice a reset session (or a reused id) and could never recover.
+_PLAYER_UPSERT_PREPARE = """
+    PREPARE player_upsert (text, int, text, text, text, text, text, text, text, text) AS
+    INSERT INTO players (name, age, weight, height, sport, country, position, team, source, player_url)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+    ON CONFLICT (player_url) DO UPDATE SET
+        age = EXCLUDED.age,
+        weight = EXCLUDED.weight,
+        height = EXCLUDED.height,
+        sport = EXCLUDED.sport,
+        country = EXCLUDED.country,
+        position = EXCLUDED.position,
+        team = EXCLUDED.team,
+        updated_at = CURRENT_TIMESTAMP;
+"""
+_PLAYER_UPSERT_EXECUTE = "EXECUTE player_upsert (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"
+
+def _execute_upsert(conn, cur, row):
+    try:
+        cur.execute(_PLAYER_UPSERT_EXECUTE, row)
+    except psycopg2.errors.InvalidSqlStatementName:
+        # First use on this session, or the session was reset since
+        conn.rollback()
+        cur.execute(_PLAYER_UPSERT_PREPARE)
+        cur.execute(_PLAYER_UPSERT_EXECUTE, row)
+
 # Insert player data into database
 def insert_player(data):
     try:
-        conn = psycopg2.connect(**db_params)
+        conn = _get_pool().getconn()
         cur = conn.cursor()
-        cur.execute("""
-            INSERT INTO players (name, age, weight, height, sport, country, position, team, source, player_url)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (player_url) DO UPDATE SET
-                age = EXCLUDED.age,
-                weight = EXCLUDED.weight,
-                height = EXCLUDED.height,
-                sport = EXCLUDED.sport,
-                country = EXCLUDED.country,
-                position = EXCLUDED.position,
-                team = EXCLUDED.team,
-                updated_at = CURRENT_TIMESTAMP;
-        """, (
+        _execute_upsert(conn, cur, (
             data['name'], data['age'], data['weight'], data['height'], data.get('sport', 'Rugby'), data['country'],
             data['position'], data['team'], data['source'], data['player_url']
         ))
@@ -265,7 +329,7 @@ def insert_player(data):
         if 'cur' in locals():
             cur.close()
         if 'conn' in locals():
-            conn.close()
+            put_db_connection(conn)
 
 # Get all team URLs from main page
 def get_all_team_urls(driver):
@@ -277,23 +341,24 @@ def get_all_team_urls(driver):
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
         time.sleep(3)
 
-        team_urls = []
+        # Build the set during collection so no duplicate URL is stored twice
+        team_urls = set()
 
         # Collect from national teams
         nation_links = driver.find_elements(By.XPATH, '//div[contains(@class, "bloc dra")]/a')
         for link in nation_links:
             href = link.get_attribute("href")
             if href:
-                team_urls.append(href)
+                team_urls.add(href)
 
         # Collect from club and tournament teams
         club_links = driver.find_elements(By.XPATH, '//div[contains(@class, "bloc clbb")]/a')
         for link in club_links:
             href = link.get_attribute("href")
             if href:
-                team_urls.append(href)
+                team_urls.add(href)
 
-        unique_urls = list(set(team_urls))
+        unique_urls = list(team_urls)
         logger.info(f"Found {len(unique_urls)} team URLs")
         return unique_urls
     except Exception as e:
@@ -307,7 +372,9 @@ def get_player_urls_from_team(driver, team_url):
         driver.get(team_url)
         time.sleep(3)
         links = driver.find_elements(By.CSS_SELECTOR, 'a[href^="/player/"]')
-        player_urls = [link.get_attribute("href") for link in links if '/player/' in link.get_attribute('href')]
+        hrefs = [link.get_attribute("href") for link in links]
+        # dict.fromkeys dedupes while preserving page order
+        player_urls = list(dict.fromkeys(href for href in hrefs if href and '/player/' in href))
         logger.info(f"Found {len(player_urls)} players in team {team_url}")
         return player_urls
     except Exception as e:
@@ -322,7 +389,7 @@ def scrape_player(driver, url):
         WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, 'div.pas')))
 
         h1_text = driver.find_element(By.CSS_SELECTOR, "h1.inbl").text.strip()
-        match = re.match(r"(.+?)\s+(\d+)\s+years,\s+(.+)", h1_text)
+        match = _H1_RE.match(h1_text)
         if match:
             name = match.group(1).strip()
             age = int(match.group(2))
@@ -351,7 +418,7 @@ def scrape_player(driver, url):
     
 def fix_worldathletics_sport_column():
     try:
-        conn = psycopg2.connect(**db_params)
+        conn = _get_pool().getconn()
         cur = conn.cursor()
         cur.execute("""
             UPDATE players
@@ -366,7 +433,7 @@ def fix_worldathletics_sport_column():
         if 'cur' in locals():
             cur.close()
         if 'conn' in locals():
-            conn.close()
+            put_db_connection(conn)
 
 # Background scraping function
 def scrape_all_background():
@@ -617,7 +684,7 @@ async def get_players(
         if 'cur' in locals():
             cur.close()
         if 'conn' in locals():
-            conn.close()
+            put_db_connection(conn)
 
 @app.get("/players/{player_id}", response_model=Player, summary="Get Player by ID")
 async def get_player(player_id: int):
@@ -660,7 +727,7 @@ async def get_player(player_id: int):
         if 'cur' in locals():
             cur.close()
         if 'conn' in locals():
-            conn.close()
+            put_db_connection(conn)
 
 @app.get("/filter-options", response_model=FilterOptions, summary="Get Filter Options")
 async def get_filter_options():
@@ -701,7 +768,7 @@ async def get_filter_options():
         if 'cur' in locals():
             cur.close()
         if 'conn' in locals():
-            conn.close()
+            put_db_connection(conn)
 
 @app.get("/stats", summary="Get Database Statistics")
 async def get_stats():
@@ -758,7 +825,7 @@ async def get_stats():
         if 'cur' in locals():
             cur.close()
         if 'conn' in locals():
-            conn.close()
+            put_db_connection(conn)
 
 @app.post("/start-scraping", summary="Start Scraping Process")
 async def start_scraping(background_tasks: BackgroundTasks):
@@ -821,7 +888,7 @@ async def get_logs(limit: int = Query(100, ge=1, le=1000, description="Number of
         if 'cur' in locals():
             cur.close()
         if 'conn' in locals():
-            conn.close()
+            put_db_connection(conn)
 
 if __name__ == "__main__":
     import uvicorn
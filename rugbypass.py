@@ -1,7 +1,15 @@
 import os
 import time
 import re
+import string
 import logging
+import queue
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urljoin
+import requests
+from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
@@ -9,8 +17,10 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.remote import remote_connection
 from webdriver_manager.chrome import ChromeDriverManager
 import psycopg2
+from psycopg2.extras import execute_values
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -25,8 +35,98 @@ db_params = {
     'port': os.getenv('DB_PORT')
 }
 
+# URL patterns blocked via CDP - we only need DOM text, so skip images/fonts/trackers
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff*", "*.ttf", "*.css", "*.mp4",
+    "*google-analytics*", "*googletagmanager*", "*doubleclick*", "*facebook.net*"
+]
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+def make_session():
+    session = requests.Session()
+    session.headers.update({'User-Agent': USER_AGENT})
+    return session
+
+def fetch_page(session, url, timeout=15):
+    """Fetch a URL over plain HTTP; returns the HTML string or None."""
+    try:
+        response = session.get(url, timeout=timeout)
+        response.raise_for_status()
+        return response.text
+    except requests.RequestException as e:
+        logger.warning("HTTP error fetching %s: %s", url, e)
+        return None
+
+# Resolved once per process - ChromeDriverManager().install() hits the network
+# to check driver metadata on every call otherwise. The resolved path is also
+# persisted next to this file so later runs skip the install() HTTP calls.
+_chromedriver_path = None
+_CHROMEDRIVER_CACHE_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '.chromedriver_path')
+
+def get_chromedriver_path():
+    global _chromedriver_path
+    if _chromedriver_path is None:
+        # A pinned path skips webdriver_manager entirely
+        pinned = os.getenv('CHROMEDRIVER_PATH')
+        if pinned and os.path.exists(pinned):
+            _chromedriver_path = pinned
+            return _chromedriver_path
+        if os.path.exists(_CHROMEDRIVER_CACHE_FILE):
+            with open(_CHROMEDRIVER_CACHE_FILE) as f:
+                cached = f.read().strip()
+            if cached and os.path.exists(cached):
+                _chromedriver_path = cached
+                return _chromedriver_path
+        _chromedriver_path = ChromeDriverManager().install()
+        try:
+            with open(_CHROMEDRIVER_CACHE_FILE, 'w') as f:
+                f.write(_chromedriver_path)
+        except OSError:
+            pass
+    return _chromedriver_path
+
+# Selenium's urllib3 pool keeps a single connection per host by default, so
+# overlapping WebDriver commands (explicit waits polling while other calls
+# run) drop the connection and reconnect serially. Widen the per-host pool.
+_original_get_connection_manager = remote_connection.RemoteConnection._get_connection_manager
+
+def _pooled_connection_manager(self):
+    manager = _original_get_connection_manager(self)
+    manager.connection_pool_kw["maxsize"] = 20
+    return manager
+
+remote_connection.RemoteConnection._get_connection_manager = _pooled_connection_manager
+
+# A Chrome started with --remote-debugging-port can be reused across runs,
+# skipping the ~1-3s cold start per invocation
+DEBUGGER_ADDRESS = os.getenv('CHROME_DEBUGGER_ADDRESS', '127.0.0.1:9222')
+
+def _debugger_available(address):
+    host, _, port = address.partition(':')
+    try:
+        with socket.create_connection((host, int(port)), timeout=0.2):
+            return True
+    except OSError:
+        return False
+
 def setup_driver():
+    if _debugger_available(DEBUGGER_ADDRESS):
+        options = Options()
+        options.page_load_strategy = 'eager'
+        options.add_experimental_option("debuggerAddress", DEBUGGER_ADDRESS)
+        driver = webdriver.Chrome(service=Service(get_chromedriver_path()), options=options)
+        driver.set_page_load_timeout(60)
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        return driver
+
     options = Options()
+    # DOMContentLoaded is enough - we only read the DOM, so don't block
+    # driver.get() on images/fonts/trackers finishing
+    options.page_load_strategy = 'eager'
     options.add_argument('--no-sandbox')
     options.add_argument('--disable-dev-shm-usage')
     options.add_argument('--disable-gpu')
@@ -34,35 +134,38 @@ def setup_driver():
     options.add_argument('--disable-blink-features=AutomationControlled')
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option('useAutomationExtension', False)
-    options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+    options.add_argument(f'--user-agent={USER_AGENT}')
     
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+    driver = webdriver.Chrome(service=Service(get_chromedriver_path()), options=options)
     driver.set_page_load_timeout(60)
-    driver.implicitly_wait(10)
+    # No implicit wait: it would delay every missed selector lookup by up to
+    # 10s. The real barriers use explicit WebDriverWait instead.
     driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    # Block non-essential resources to cut page-load bytes
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
     return driver
 
+# One XPath union covering every accept/consent/agree selector, so the page is
+# probed once instead of once per selector
+POPUP_BUTTON_XPATH = (
+    "//button[contains(@id, 'accept') or contains(@class, 'accept')"
+    " or contains(@id, 'consent') or contains(@class, 'consent')"
+    " or contains(@id, 'agree') or contains(@class, 'agree')"
+    " or contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'accept')]"
+)
+
 def accept_popups(driver):
-    popup_selectors = [
-        "button[id*='accept']", "button[class*='accept']", "button[id*='consent']",
-        "button[class*='consent']", "button[id*='agree']", "button[class*='agree']",
-        "//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'accept')]"
-    ]
-    
-    for selector in popup_selectors:
-        try:
-            if selector.startswith("//"):
-                elements = WebDriverWait(driver, 3).until(EC.presence_of_all_elements_located((By.XPATH, selector)))
-            else:
-                elements = WebDriverWait(driver, 3).until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, selector)))
-            
-            for element in elements:
-                if element.is_displayed() and element.is_enabled():
-                    driver.execute_script("arguments[0].click();", element)
-                    time.sleep(3)
-                    return True
-        except TimeoutException:
-            continue
+    try:
+        elements = WebDriverWait(driver, 2).until(
+            EC.presence_of_all_elements_located((By.XPATH, POPUP_BUTTON_XPATH)))
+    except TimeoutException:
+        return False
+
+    for element in elements:
+        if element.is_displayed() and element.is_enabled():
+            driver.execute_script("arguments[0].click();", element)
+            return True
     return False
 
 def init_db():
@@ -89,12 +192,65 @@ def init_db():
     cur.close()
     conn.close()
 
+# Compiled once at import - these run for every scraped player
+_DIGIT_RE = re.compile(r'(\d+)')
+_QUOTE_STRIP_RE = re.compile(r"^[\"']+|[\"']+$")
+# Deletes punctuation (except - and _) in one C-level pass when slugifying
+_SLUG_TRANS = str.maketrans('', '', ''.join(
+    c for c in string.punctuation if c not in '-_'))
+_DETAILS_PATTERNS = {
+    'age': re.compile(r'age[:\s]+(\d+)'),
+    'height': re.compile(r'height[:\s]+([^\n]+)'),
+    'weight': re.compile(r'weight[:\s]+([^\n]+)'),
+    'position': re.compile(r'position[:\s]+([^\n]+)')
+    # 'team': re.compile(r'team[:\s]+([^\n]+)')
+}
+
+# List of rugby nations to search for
+_COUNTRY_NAMES = ['england', 'wales', 'scotland', 'ireland', 'france', 'italy', 'argentina',
+                  'australia', 'new zealand', 'south africa', 'japan', 'tonga', 'samoa',
+                  'fiji', 'georgia', 'romania', 'uruguay', 'canada', 'usa', 'portugal',
+                  'chile', 'brazil', 'hong kong', 'spain', 'russia', 'germany', 'belgium',
+                  'netherlands', 'poland', 'czech republic', 'ukraine', 'kenya', 'namibia',
+                  'zimbabwe', 'madagascar', 'tunisia', 'morocco', 'senegal', 'ivory coast']
+
+# Frozenset for O(1) membership tests on individual lines/attributes
+_COUNTRY_SET = frozenset(_COUNTRY_NAMES)
+
+# Selectors that might carry country info, tried in order as a last resort
+_COUNTRY_SELECTORS = (
+    "img[alt*='flag']",
+    "img[src*='flag']",
+    "div.team-logo",
+    "div.country",
+    "span.country",
+    "div[class*='team']",
+    "div[class*='country']",
+    "img[alt]",
+    "img[title]"
+)
+
+# Two alternation scans over the document replace the old nested loops
+# (40 countries x 7 patterns, each re.search walking the whole page).
+# Longest names first so e.g. 'new zealand' wins over a bare substring.
+_COUNTRY_ALT = '|'.join(sorted(_COUNTRY_NAMES, key=len, reverse=True))
+# Attribute contexts are the most reliable signal, so they're scanned first.
+# No IGNORECASE: these only ever run against pre-lowercased page source,
+# and case-sensitive matching is measurably cheaper.
+_COUNTRY_ATTR_RE = re.compile(
+    r'(?:alt|title|data-country)="(' + _COUNTRY_ALT + r')"')
+_COUNTRY_TEXT_RE = re.compile(
+    r'>(' + _COUNTRY_ALT + r')<'
+    r'|country">(' + _COUNTRY_ALT + r')'
+    r'|team-logo.{0,300}?(' + _COUNTRY_ALT + r')'
+    r'|(' + _COUNTRY_ALT + r').{0,300}?team-logo')
+
 def cm_to_feet_inches(cm_str):
     """Convert centimeters to feet'inches" format"""
     if not cm_str:
         return None
     try:
-        cm_match = re.search(r'(\d+)', cm_str)
+        cm_match = _DIGIT_RE.search(cm_str)
         if cm_match:
             cm = int(cm_match.group(1))
             inches = cm / 2.54
@@ -110,125 +266,156 @@ def extract_weight_kg(weight_str):
     if not weight_str:
         return None
     try:
-        weight_match = re.search(r'(\d+)', weight_str)
+        weight_match = _DIGIT_RE.search(weight_str)
         if weight_match:
             return weight_match.group(1)
     except:
         pass
     return None
 
-def insert_player(player):
+_PLAYER_UPSERT_SQL = """
+    INSERT INTO players (name, age, weight, height, sport, position, country, team, source, player_url)
+    VALUES %s
+    ON CONFLICT (player_url) DO UPDATE SET
+        age = EXCLUDED.age,
+        weight = EXCLUDED.weight,
+        height = EXCLUDED.height,
+        sport = EXCLUDED.sport,
+        position = EXCLUDED.position,
+        country = EXCLUDED.country,
+        team = EXCLUDED.team,
+        updated_at = CURRENT_TIMESTAMP;
+"""
+
+def player_row(player):
+    """Build the upsert tuple for a scraped player."""
+    details = player.get('detailed_bio', {})
+
+    age = None
+    if details.get('age'):
+        try:
+            age = int(_DIGIT_RE.search(str(details['age'])).group())
+        except:
+            pass
+
+    # Convert weight and height
+    weight = extract_weight_kg(details.get('weight'))
+    height = cm_to_feet_inches(details.get('height'))
+
+    return (
+        player['name'],
+        age,
+        weight,
+        height,
+        'Rugby',  # Default sport
+        details.get('position') or player.get('position'),
+        details.get('country') or 'Unknown',
+        details.get('team'),
+        'rugbypass.com',
+        player.get('player_link')
+    )
+
+def flush_players(conn, cur, buffer):
+    """Upsert the buffered rows in one execute_values round-trip."""
+    if not buffer:
+        return
     try:
-        conn = psycopg2.connect(**db_params)
-        cur = conn.cursor()
-        details = player.get('detailed_bio', {})
-        
-        age = None
-        if details.get('age'):
-            try:
-                age = int(re.search(r'\d+', str(details['age'])).group())
-            except:
-                pass
-        
-        # Convert weight and height
-        weight = extract_weight_kg(details.get('weight'))
-        height = cm_to_feet_inches(details.get('height'))
-        
-        cur.execute("""
-            INSERT INTO players (name, age, weight, height, sport, position, country, team, source, player_url)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (player_url) DO UPDATE SET
-                age = EXCLUDED.age,
-                weight = EXCLUDED.weight,
-                height = EXCLUDED.height,
-                sport = EXCLUDED.sport,
-                position = EXCLUDED.position,
-                country = EXCLUDED.country,
-                team = EXCLUDED.team,
-                updated_at = CURRENT_TIMESTAMP;
-        """, (
-            player['name'],
-            age,
-            weight,
-            height,
-            'Rugby',  # Default sport
-            details.get('position') or player.get('position'),
-            details.get('country') or 'Unknown',
-            details.get('team'),
-            'rugbypass.com',
-            player.get('player_link')
-        ))
+        execute_values(cur, _PLAYER_UPSERT_SQL, buffer, page_size=500)
         conn.commit()
-        print(f"✓ Saved: {player['name']} (Age: {age}, Country: {details.get('country')}, Weight: {weight}, Height: {height})")
+        logger.info("Saved batch of %d players", len(buffer))
     except Exception as e:
-        print(f"❌ DB Error for {player['name']}: {e}")
+        conn.rollback()
+        logger.error("DB error flushing %d players: %s", len(buffer), e)
     finally:
-        if 'cur' in locals():
-            cur.close()
-        if 'conn' in locals():
-            conn.close()
+        buffer.clear()
 
 def construct_player_url(player_name):
     try:
-        url_name = re.sub(r'[^\w\s-]', '', player_name.lower())
-        url_name = re.sub(r'\s+', '-', url_name.strip())
-        url_name = re.sub(r'-+', '-', url_name)
+        cleaned = player_name.lower().translate(_SLUG_TRANS)
+        url_name = '-'.join(cleaned.split())
+        while '--' in url_name:
+            url_name = url_name.replace('--', '-')
         return f"https://www.rugbypass.com/players/{url_name}/"
     except Exception as e:
-        print(f"Error constructing URL for {player_name}: {e}")
+        logger.error("Error constructing URL for %s: %s", player_name, e)
         return None
 
+def _players_from_container(container):
+    """Extract player name/link dicts from a parsed #list-players container."""
+    players_found = []
+    for link in container.select("a[href*='/players/']"):
+        try:
+            href = link.get('href')
+            name = _QUOTE_STRIP_RE.sub("", link.get_text(separator='\n').strip().split('\n')[0])
+            if href and name and '/players/' in href:
+                player_data = {
+                    'name': name,
+                    'player_link': urljoin("https://www.rugbypass.com/", href),
+                    'team': '',
+                    'position': ''
+                }
+                players_found.append(player_data)
+        except:
+            continue
+    return players_found
+
+def list_players(session, base_url, page):
+    """Fetch and parse one listing page over plain HTTP."""
+    url = base_url if page == 1 else f"{base_url}?p={page}"
+    html = fetch_page(session, url)
+    if html is None:
+        return []
+    soup = BeautifulSoup(html, 'html.parser')
+    container = soup.select_one("#list-players")
+    if container is None:
+        return []
+    return _players_from_container(container)
+
 def scrape_players_from_page(driver):
     try:
         WebDriverWait(driver, 20).until(EC.presence_of_element_located((By.ID, "list-players")))
-        player_container = driver.find_element(By.ID, "list-players")
-        
-        # Try direct player links first
-        player_links = player_container.find_elements(By.CSS_SELECTOR, "a[href*='/players/']")
-        
-        if player_links:
-            players_found = []
-            for link in player_links:
-                try:
-                    href = link.get_attribute('href')
-                    name = re.sub(r"^[\"']+|[\"']+$", "", link.get_attribute("innerText").strip().split('\n')[0])
-                    if href and name and '/players/' in href:
-                        player_data = {
-                            'name': name,
-                            'player_link': href,
-                            'team': '',
-                            'position': ''
-                        }
-                        players_found.append(player_data)
-                except:
-                    continue
-            if players_found:
-                return players_found
-        
+
+        # Pull the container HTML in one round-trip and parse it locally -
+        # per-link find_elements/get_attribute calls each cost a WebDriver
+        # round-trip, this costs exactly one
+        container_html = driver.execute_script(
+            "return document.getElementById('list-players').outerHTML;")
+        container = BeautifulSoup(container_html, 'html.parser')
+
+        players_found = _players_from_container(container)
+        if players_found:
+            return players_found
+
         # Fallback: parse text content
-        return parse_player_text_with_links(player_container)
-        
+        return parse_player_text_with_links(driver.find_element(By.ID, "list-players"))
+
     except Exception as e:
-        print(f"Error in scrape_players_from_page: {e}")
+        logger.error("Error in scrape_players_from_page: %s", e)
         return []
 
+# Header/navigation lines skipped while pairing name/team/position rows -
+# one compiled alternation scan per line instead of eight substring checks
+_SKIP_LINE_RE = re.compile(
+    r'name|team|position|current squad|filter|tournaments|teams|positions',
+    re.IGNORECASE
+)
+
 def parse_player_text_with_links(container):
     try:
         text_content = container.text
         if not text_content or len(text_content) < 10:
             return []
-        
-        lines = [line.strip() for line in text_content.split('\n') if line.strip()]
+
+        lines = [line.strip() for line in text_content.splitlines() if line.strip()]
         players = []
         i = 0
-        
+
         while i < len(lines) - 2:
             potential_name = lines[i]
             potential_team = lines[i + 1] if i + 1 < len(lines) else ""
             potential_position = lines[i + 2] if i + 2 < len(lines) else ""
-            
-            skip_patterns = ["name", "team", "position", "current squad", "filter", "tournaments", "teams", "positions"]
-            if any(pattern in potential_name.lower() for pattern in skip_patterns):
+
+            if _SKIP_LINE_RE.search(potential_name):
                 i += 1
                 continue
             
@@ -250,186 +437,282 @@ def parse_player_text_with_links(container):
         return players
         
     except Exception as e:
-        print(f"Error in parse_player_text_with_links: {e}")
+        logger.error("Error in parse_player_text_with_links: %s", e)
         return []
 
-def scrape_player_bio(driver, url):
+def extract_bio_details(html):
+    """Pull country/age/height/weight/position out of a bio page's HTML.
+
+    Works on the raw HTML string so the HTTP path and the Selenium fallback
+    (via driver.page_source) share one parser.
+    """
+    extracted_details = {}
+    soup = BeautifulSoup(html, 'html.parser')
+    # Lowercase both views once; every check below works on these
+    page_source = html.lower()
+    body_text = soup.get_text(separator='\n')
+    body_text_lower = body_text.lower()
+
+    # Strategy 1: Extract country from page source and visible text
     try:
-        original_window = driver.current_window_handle
-        driver.execute_script("window.open(arguments[0], '_blank');", url)
-        time.sleep(2)
-        
-        if len(driver.window_handles) > 1:
-            driver.switch_to.window(driver.window_handles[-1])
-        
-        WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-        time.sleep(2)
-        
-        if "404" in driver.title.lower() or "not found" in driver.title.lower():
-            return {}
-        
-        extracted_details = {}
-        
-        # Strategy 1: Extract country from page source and visible text
-        try:
-            # Get the page source and visible text
-            page_source = driver.page_source.lower()
-            body_text = driver.find_element(By.TAG_NAME, "body").text
-            
-            # List of rugby nations to search for
-            country_names = ['england', 'wales', 'scotland', 'ireland', 'france', 'italy', 'argentina', 
-                           'australia', 'new zealand', 'south africa', 'japan', 'tonga', 'samoa', 
-                           'fiji', 'georgia', 'romania', 'uruguay', 'canada', 'usa', 'portugal', 
-                           'chile', 'brazil', 'hong kong', 'spain', 'russia', 'germany', 'belgium',
-                           'netherlands', 'poland', 'czech republic', 'ukraine', 'kenya', 'namibia',
-                           'zimbabwe', 'madagascar', 'tunisia', 'morocco', 'senegal', 'ivory coast']
-            
-            # First try to find country from visible text
-            for line in body_text.split('\n'):
-                line = line.strip()
-                if line.lower() in country_names:
-                    extracted_details['country'] = line.title()
-                    print(f"Found country from visible text: {line.title()}")
-                    break
-            
-            # If not found in visible text, try to find in page source
-            if 'country' not in extracted_details:
-                for country in country_names:
-                    # Look for country in various contexts in the HTML
-                    patterns = [
-                        f'alt="{country}"',
-                        f'title="{country}"',
-                        f'>{country}<',
-                        f'data-country="{country}"',
-                        f'country">{country}',
-                        f'team-logo.*{country}',
-                        f'{country}.*team-logo'
-                    ]
-                    
-                    for pattern in patterns:
-                        if re.search(pattern, page_source, re.IGNORECASE):
-                            extracted_details['country'] = country.title()
-                            print(f"Found country from page source: {country.title()}")
+        # First try to find country from visible text
+        for line in body_text_lower.split('\n'):
+            line = line.strip()
+            if line in _COUNTRY_SET:
+                extracted_details['country'] = line.title()
+                logger.debug("Found country from visible text: %s", line.title())
+                break
+
+        # If not found in visible text, try to find in page source - one
+        # linear alternation scan instead of a loop per country and pattern
+        if 'country' not in extracted_details:
+            match = _COUNTRY_ATTR_RE.search(page_source) or _COUNTRY_TEXT_RE.search(page_source)
+            if match:
+                country = next(g for g in match.groups() if g)
+                extracted_details['country'] = country.title()
+                logger.debug("Found country from page source: %s", country.title())
+
+        # Try to find country from any element that might contain it
+        if 'country' not in extracted_details:
+            for selector in _COUNTRY_SELECTORS:
+                for element in soup.select(selector):
+                    # Check alt, title, and text content
+                    for attr in ['alt', 'title', 'text']:
+                        if attr == 'text':
+                            text = element.get_text().strip()
+                        else:
+                            text = element.get(attr)
+
+                        if text and text.lower() in _COUNTRY_SET:
+                            extracted_details['country'] = text.title()
+                            logger.debug("Found country from element %s %s: %s", selector, attr, text.title())
                             break
-                    
+
                     if 'country' in extracted_details:
                         break
-            
-            # Try to find country from any element that might contain it
-            if 'country' not in extracted_details:
-                try:
-                    # Try various selectors that might contain country info
-                    selectors = [
-                        "img[alt*='flag']",
-                        "img[src*='flag']",
-                        "div.team-logo",
-                        "div.country",
-                        "span.country",
-                        "div[class*='team']",
-                        "div[class*='country']",
-                        "img[alt]",
-                        "img[title]"
-                    ]
-                    
-                    for selector in selectors:
-                        try:
-                            elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                            for element in elements:
-                                # Check alt, title, and text content
-                                for attr in ['alt', 'title', 'text']:
-                                    try:
-                                        if attr == 'text':
-                                            text = element.text.strip()
-                                        else:
-                                            text = element.get_attribute(attr)
-                                        
-                                        if text and text.lower() in country_names:
-                                            extracted_details['country'] = text.title()
-                                            print(f"Found country from element {selector} {attr}: {text.title()}")
-                                            break
-                                    except:
-                                        continue
-                                
-                                if 'country' in extracted_details:
-                                    break
-                            
-                            if 'country' in extracted_details:
-                                break
-                        except:
-                            continue
-                except:
-                    pass
-                        
-        except Exception as e:
-            print(f"Could not extract country: {e}")
-        
-        # Strategy 2: Extract other details from player-details
-        try:
-            player_details = driver.find_element(By.CSS_SELECTOR, "div.player-details")
-            detail_sections = player_details.find_elements(By.CSS_SELECTOR, "div.detail")
-            
-            for detail_section in detail_sections:
-                try:
-                    h3_element = detail_section.find_element(By.TAG_NAME, "h3")
-                    heading = h3_element.text.strip().lower()
-                    content_element = detail_section.find_element(By.TAG_NAME, "p")
-                    content = content_element.text.strip()
-                    
-                    if 'age' in heading:
-                        match = re.search(r'(\d+)', content)
-                        if match:
-                            extracted_details['age'] = match.group(1)
-                    elif 'height' in heading:
-                        extracted_details['height'] = content
-                    elif 'weight' in heading:
-                        extracted_details['weight'] = content
-                    elif 'position' in heading:
-                        extracted_details['position'] = content
-                    # elif 'team' in heading or 'club' in heading:
-                    #     extracted_details['team'] = content
-                except:
-                    continue
-        except Exception as e:
-            print(f"Could not extract player details: {e}")
-        
-        # Strategy 3: Fallback text extraction
-        if not any(key in extracted_details for key in ['age', 'height', 'weight', 'position']):
+
+                if 'country' in extracted_details:
+                    break
+
+    except Exception as e:
+        logger.warning("Could not extract country: %s", e)
+
+    # Strategy 2: Extract other details from player-details
+    try:
+        player_details = soup.select_one("div.player-details")
+        detail_sections = player_details.select("div.detail") if player_details else []
+
+        for detail_section in detail_sections:
             try:
-                body_text = driver.find_element(By.TAG_NAME, "body").text.lower()
-                details_patterns = {
-                    'age': r'age[:\s]+(\d+)',
-                    'height': r'height[:\s]+([^\n]+)',
-                    'weight': r'weight[:\s]+([^\n]+)',
-                    'position': r'position[:\s]+([^\n]+)'
-                    # 'team': r'team[:\s]+([^\n]+)'
-                }
-                
-                for key, pattern in details_patterns.items():
-                    if key not in extracted_details:
-                        match = re.search(pattern, body_text)
-                        if match:
-                            extracted_details[key] = match.group(1).strip()
+                h3_element = detail_section.find("h3")
+                content_element = detail_section.find("p")
+                if h3_element is None or content_element is None:
+                    continue
+                heading = h3_element.get_text().strip().lower()
+                content = content_element.get_text().strip()
+
+                if 'age' in heading:
+                    match = _DIGIT_RE.search(content)
+                    if match:
+                        extracted_details['age'] = match.group(1)
+                elif 'height' in heading:
+                    extracted_details['height'] = content
+                elif 'weight' in heading:
+                    extracted_details['weight'] = content
+                elif 'position' in heading:
+                    extracted_details['position'] = content
+                # elif 'team' in heading or 'club' in heading:
+                #     extracted_details['team'] = content
             except:
-                pass
-        
-        return extracted_details
-        
+                continue
     except Exception as e:
-        print(f"Error scraping bio: {e}")
-        return {}
-    finally:
+        logger.warning("Could not extract player details: %s", e)
+
+    # Strategy 3: Fallback text extraction
+    if not any(key in extracted_details for key in ['age', 'height', 'weight', 'position']):
         try:
-            if len(driver.window_handles) > 1:
-                driver.close()
-                driver.switch_to.window(driver.window_handles[0])
+            for key, pattern in _DETAILS_PATTERNS.items():
+                if key not in extracted_details:
+                    match = pattern.search(body_text_lower)
+                    if match:
+                        extracted_details[key] = match.group(1).strip()
         except:
             pass
 
-def scrape_all_pages():
-    base_url = "https://www.rugbypass.com/players/"
+    return extracted_details
+
+def scrape_player_bio_http(session, url):
+    """Fetch a bio page over plain HTTP and parse it."""
+    html = fetch_page(session, url)
+    if html is None:
+        return {}
+    title = re.search(r'<title[^>]*>(.*?)</title>', html, re.IGNORECASE | re.DOTALL)
+    if title and ("404" in title.group(1).lower() or "not found" in title.group(1).lower()):
+        return {}
+    return extract_bio_details(html)
+
+def scrape_player_bio(driver, url):
+    try:
+        # Navigate the current tab - opening a new window per player allocates
+        # a whole renderer process and leaks memory over long runs. The player
+        # links were already collected as strings, so the listing page isn't
+        # needed between bio visits.
+        driver.get(url)
+        try:
+            WebDriverWait(driver, 5).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "div.player-details")))
+        except TimeoutException:
+            # Not every bio page renders the details container; the
+            # body-text fallbacks in extract_bio_details cover that
+            pass
+
+        if "404" in driver.title.lower() or "not found" in driver.title.lower():
+            return {}
+
+        # Parse the rendered HTML locally - every find_element/get_attribute
+        # would be its own WebDriver round-trip, page_source is one
+        return extract_bio_details(driver.page_source)
+
+    except Exception as e:
+        logger.error("Error scraping bio: %s", e)
+        return {}
+
+# Sentinels telling the DB writer thread to flush the buffer / stop
+_DB_QUEUE_FLUSH = object()
+_DB_QUEUE_DONE = object()
+
+_DB_FLUSH_SIZE = 500
+
+def _db_writer(player_queue):
+    """Consume scraped players and persist them in the background.
+
+    Running inserts on a separate thread overlaps DB latency with the next
+    bio fetch instead of blocking the scrape loop on every commit. One
+    connection lives for the whole run and rows are buffered and flushed in
+    batches, so the DB sees one round-trip per batch instead of a
+    connect/INSERT/commit cycle per player.
+
+    The connection is established lazily and re-established after a
+    failure: if the database is down the writer logs and drops the batch
+    instead of dying, so the bounded queue keeps draining and producers
+    blocked on player_queue.put() are never stranded.
+    """
+    conn = None
+    cur = None
+    buffer = []
+
+    def _flush():
+        nonlocal conn, cur
+        if not buffer:
+            return
+        if conn is None:
+            try:
+                conn = psycopg2.connect(**db_params)
+                cur = conn.cursor()
+            except psycopg2.Error as e:
+                logger.error("DB writer: connect failed, dropping %d players: %s",
+                             len(buffer), e)
+                buffer.clear()
+                return
+        try:
+            flush_players(conn, cur, buffer)
+        except psycopg2.Error as e:
+            # Connection died mid-flush; discard it and reconnect for the
+            # next batch (flush_players already cleared the buffer)
+            logger.error("DB writer: connection lost during flush: %s", e)
+            try:
+                conn.close()
+            except Exception:
+                pass
+            conn = cur = None
+
+    try:
+        while True:
+            item = player_queue.get()
+            if item is _DB_QUEUE_DONE:
+                break
+            if item is _DB_QUEUE_FLUSH:
+                _flush()
+                continue
+            try:
+                buffer.append(player_row(item))
+            except Exception as e:
+                logger.error("Bad player row for %s: %s", item.get('name', 'Unknown'), e)
+                continue
+            if len(buffer) >= _DB_FLUSH_SIZE:
+                _flush()
+        _flush()
+    finally:
+        if cur is not None:
+            cur.close()
+        if conn is not None:
+            conn.close()
+
+# Upper bound on in-flight bio requests; doubles as the politeness limit
+_BIO_WORKERS = 20
+
+def _fetch_bio(session, player):
+    player['detailed_bio'] = scrape_player_bio_http(session, player['player_link'])
+    return player
+
+def scrape_pages_http(base_url, max_pages, player_queue):
+    """Scrape listing and bio pages over plain HTTP.
+
+    Returns None when the first listing page yields nothing, so the caller
+    can fall back to the Selenium path for JS-rendered markup.
+    """
+    all_players = []
+    session = make_session()
+
+    # Listing pages are independent (?p=N), so fetch them all up front in
+    # parallel; the bio fan-out below then keeps the workers busy per page
+    with ThreadPoolExecutor(max_workers=min(max_pages, _BIO_WORKERS)) as executor:
+        page_players = list(executor.map(
+            lambda page: list_players(session, base_url, page),
+            range(1, max_pages + 1)))
+
+    if not page_players[0]:
+        return None
+
+    for page, players in enumerate(page_players, start=1):
+        logger.info("Scraping page %d...", page)
+
+        if not players:
+            logger.info("No players found on page %d, stopping.", page)
+            break
+
+        logger.info("Found %d players on page %d", len(players), page)
+
+        to_fetch = []
+        for player in players:
+            if player.get('player_link'):
+                to_fetch.append(player)
+            else:
+                logger.debug("Skipping %s - no link", player.get('name', 'Unknown'))
+
+        # Bio pages are independent, so fetch them concurrently; the worker
+        # cap bounds how hard we hit the site, no per-request sleep needed
+        with ThreadPoolExecutor(max_workers=_BIO_WORKERS) as executor:
+            futures = {executor.submit(_fetch_bio, session, p): p for p in to_fetch}
+            for future in as_completed(futures):
+                try:
+                    player = future.result()
+                except Exception as e:
+                    failed = futures[future]
+                    logger.error("Error processing player %s: %s", failed.get('name', 'Unknown'), e)
+                    continue
+                player_queue.put(player)
+                all_players.append(player)
+
+        # Flush what this page produced before moving on
+        player_queue.put(_DB_QUEUE_FLUSH)
+
+    return all_players
+
+def scrape_pages_selenium(base_url, max_pages, player_queue):
+    """Selenium fallback for when the listing isn't served over plain HTTP."""
     driver = setup_driver()
     all_players = []
-    max_pages = 5
 
     try:
         driver.get(base_url)
@@ -438,14 +721,14 @@ def scrape_all_pages():
         time.sleep(5)
         
         for page in range(1, max_pages + 1):
-            print(f"\n🔄 Scraping page {page}...")
+            logger.info("Scraping page %d...", page)
             
             players = scrape_players_from_page(driver)
             if not players:
-                print(f"⚠️ No players found on page {page}, stopping.")
+                logger.info("No players found on page %d, stopping.", page)
                 break
             
-            print(f"Found {len(players)} players on page {page}")
+            logger.info("Found %d players on page %d", len(players), page)
             
             for i, player in enumerate(players):
                 try:
@@ -453,18 +736,21 @@ def scrape_all_pages():
                     player_link = player.get('player_link')
                     
                     if player_link:
-                        print(f"Scraping bio {i+1}/{len(players)}: {player_name}")
+                        logger.debug("Scraping bio %d/%d: %s", i + 1, len(players), player_name)
                         detailed_bio = scrape_player_bio(driver, player_link)
                         player['detailed_bio'] = detailed_bio
-                        insert_player(player)
+                        player_queue.put(player)
                         all_players.append(player)
                         time.sleep(2)
                     else:
-                        print(f"Skipping {player_name} - no link")
+                        logger.debug("Skipping %s - no link", player_name)
                 except Exception as e:
-                    print(f"Error processing player {player.get('name', 'Unknown')}: {e}")
+                    logger.error("Error processing player %s: %s", player.get('name', 'Unknown'), e)
                     continue
             
+            # Flush what this page produced before moving on
+            player_queue.put(_DB_QUEUE_FLUSH)
+
             # Navigate to next page
             if page < max_pages:
                 try:
@@ -473,34 +759,55 @@ def scrape_all_pages():
                     time.sleep(3)
                     WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.ID, "list-players")))
                 except TimeoutException:
-                    print("No more pages found")
+                    logger.info("No more pages found")
                     break
 
     except Exception as e:
-        print(f"Error in scrape_all_pages: {e}")
+        logger.error("Error in scrape_pages_selenium: %s", e)
     finally:
         driver.quit()
 
     return all_players
 
+def scrape_all_pages():
+    base_url = "https://www.rugbypass.com/players/"
+    max_pages = 5
+
+    player_queue = queue.Queue(maxsize=256)
+    writer = threading.Thread(target=_db_writer, args=(player_queue,), daemon=True)
+    writer.start()
+
+    try:
+        # HTTP first: the listing and bio pages are server-rendered, and a
+        # plain GET avoids the per-action WebDriver round-trips entirely.
+        all_players = scrape_pages_http(base_url, max_pages, player_queue)
+        if all_players is None:
+            logger.info("Listing not usable over plain HTTP, falling back to Selenium")
+            all_players = scrape_pages_selenium(base_url, max_pages, player_queue)
+    finally:
+        player_queue.put(_DB_QUEUE_DONE)
+        writer.join()
+
+    return all_players
+
 def main():
-    print("=== Starting Enhanced RugbyPass Player Scraper ===")
+    logger.info("=== Starting Enhanced RugbyPass Player Scraper ===")
     init_db()
-    print("✓ Database initialized")
+    logger.info("Database initialized")
     
     players = scrape_all_pages()
-    print(f"\n=== Scraping Complete ===")
-    print(f"Total players processed: {len(players)}")
+    logger.info("=== Scraping Complete ===")
+    logger.info("Total players processed: %d", len(players))
     
     players_with_country = [p for p in players if p.get('detailed_bio', {}).get('country')]
     players_with_age = [p for p in players if p.get('detailed_bio', {}).get('age')]
     players_with_weight = [p for p in players if p.get('detailed_bio', {}).get('weight')]
     players_with_height = [p for p in players if p.get('detailed_bio', {}).get('height')]
     
-    print(f"Players with country: {len(players_with_country)}")
-    print(f"Players with age: {len(players_with_age)}")
-    print(f"Players with weight: {len(players_with_weight)}")
-    print(f"Players with height: {len(players_with_height)}")
+    logger.info("Players with country: %d", len(players_with_country))
+    logger.info("Players with age: %d", len(players_with_age))
+    logger.info("Players with weight: %d", len(players_with_weight))
+    logger.info("Players with height: %d", len(players_with_height))
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
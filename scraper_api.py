@@ -1,12 +1,16 @@
 import os
+import io
+import csv
 import json
 import time
 import urllib.parse
 import re
 from datetime import datetime
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, Query, BackgroundTasks
+import hashlib
+from fastapi import FastAPI, HTTPException, Query, BackgroundTasks, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
@@ -14,7 +18,6 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
 from apscheduler.schedulers.background import BackgroundScheduler
 
 # Importing external basketball scrapers
@@ -29,16 +32,23 @@ from basketlatin import process_country as process_basket_latin_country, latin_c
 # from ultimate_rugby_scraper import scrape_ultimate_rugby_players
 from ultimate import scrape_ultimate_rugby_players
 
-# Importing other scrapers
-from rugbypass import scrape_all_pages
+# Importing other scrapers (plus the shared HTTP fetch helpers)
+from rugbypass import scrape_all_pages, make_session, fetch_page, get_chromedriver_path
 from athletics_scraper import scrape_all_athletics
+from bs4 import BeautifulSoup
 
 import psycopg2
+from psycopg2 import pool as pg_pool
+from psycopg2.extras import execute_values, RealDictCursor
 import logging
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal
 from pydantic import BaseModel
-import math
+import asyncio
+import queue
 import threading
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -46,9 +56,34 @@ logger = logging.getLogger(__name__)
 
 load_dotenv()
 
-app = FastAPI(title="Sport Player API", version="1.0.0")
+# orjson serializes several times faster than stdlib json, which matters
+# for /players and /logs responses with hundreds of rows; it also handles
+# datetime fields natively
+app = FastAPI(title="Sport Player API", version="1.0.0", default_response_class=ORJSONResponse)
 scheduler = BackgroundScheduler()
 
+# Conditional GET for the slow-moving endpoints: dashboards poll these,
+# and on an If-None-Match hit the client gets a bodyless 304 - no
+# serialization re-parse or response bytes on the wire. The content hash
+# is cheap next to the DB work it spares the client from re-downloading.
+_ETAG_PATHS = ('/filter-options', '/stats')
+
+@app.middleware("http")
+async def etag_middleware(request, call_next):
+    response = await call_next(request)
+    if (request.method == "GET" and response.status_code == 200
+            and (request.url.path in _ETAG_PATHS
+                 or (request.url.path.startswith('/players/') and request.url.path.count('/') == 2))):
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        etag = 'W/"{}"'.format(hashlib.blake2b(body, digest_size=16).hexdigest())
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        headers = dict(response.headers)
+        headers["ETag"] = etag
+        return Response(content=body, status_code=response.status_code,
+                        headers=headers, media_type=response.media_type)
+    return response
+
 # Add CORS middleware to allow frontend access
 app.add_middleware(
     CORSMiddleware,
@@ -68,6 +103,24 @@ db_params = {
 }
 
 # Global variables for scraping status
+# Guards the errors list and multi-field reads of scraping_status - scraper
+# workers, log_error and the status endpoint all touch it concurrently.
+# Single-field flag reads/writes stay lock-free (atomic under the GIL).
+_status_lock = threading.Lock()
+# Wakes /scraping-status/stream clients on major state transitions so they
+# push immediately instead of waiting for the next change check. Each
+# stream registers a (loop, asyncio.Event) pair; _notify_status_change
+# runs on scraper threads, so the events are set on their owning loop
+# via call_soon_threadsafe.
+_status_subscribers = set()
+_status_subscribers_lock = threading.Lock()
+
+def _notify_status_change():
+    with _status_subscribers_lock:
+        subscribers = list(_status_subscribers)
+    for loop, event in subscribers:
+        loop.call_soon_threadsafe(event.set)
+
 scraping_status = {
     'is_running': False,
     'processed': 0,
@@ -75,7 +128,7 @@ scraping_status = {
     'current_item': '',
     'total_items': 0,
     'start_time': None,
-    'errors': []
+    'errors': deque(maxlen=10)  # ring buffer: caps itself in O(1) on append
 }
 
 # Pydantic models for API responses
@@ -119,50 +172,200 @@ class ScrapingStatus(BaseModel):
     start_time: Optional[datetime] = None
     errors: List[str]
 
+# Shared connection pool - a fresh psycopg2.connect pays the full
+# TCP + auth handshake, which dominated per-row insert and log calls
+_connection_pool = None
+
+def _get_pool():
+    global _connection_pool
+    if _connection_pool is None:
+        # Default maxconn matches Starlette's 40-thread request pool so a
+        # fully busy API can't drain the pool by itself; tunable per
+        # deployment via env
+        _connection_pool = pg_pool.ThreadedConnectionPool(
+            minconn=int(os.getenv('DB_POOL_MIN', '2')),
+            maxconn=int(os.getenv('DB_POOL_MAX', '40')),
+            **db_params)
+    return _connection_pool
+
+# How long a caller waits for a pool slot before giving up
+_POOL_WAIT_TIMEOUT = 5.0
+
 # Database connection helper
 def get_db_connection():
+    # getconn() raises PoolError immediately when the pool is drained
+    # instead of queueing, so a burst wider than maxconn would turn
+    # straight into errors - retry briefly to wait for a slot instead
+    deadline = time.monotonic() + _POOL_WAIT_TIMEOUT
+    while True:
+        try:
+            return _get_pool().getconn()
+        except pg_pool.PoolError as e:
+            if time.monotonic() >= deadline:
+                logger.error(f"Connection pool exhausted: {e}")
+                raise HTTPException(status_code=503, detail="Server busy, please retry")
+            time.sleep(0.05)
+        except psycopg2.Error as e:
+            logger.error(f"Database connection failed: {e}")
+            raise HTTPException(status_code=500, detail="Database connection failed")
+
+def put_db_connection(conn):
+    if conn is not None and _connection_pool is not None:
+        _connection_pool.putconn(conn)
+
+@contextmanager
+def db_cursor(cursor_factory=None):
+    """Pooled connection + cursor as a context manager.
+
+    Replaces the per-endpoint try/finally blocks and their
+    `if 'cur' in locals()` guards: the cursor is closed and the
+    connection returned to the pool on every exit path. The connection
+    is rolled back before going back so it never sits in the pool
+    idle-in-transaction, and a query error can't leave an aborted
+    transaction for the next checkout."""
+    conn = get_db_connection()
     try:
-        conn = psycopg2.connect(**db_params)
-        return conn
-    except psycopg2.Error as e:
-        logger.error(f"Database connection failed: {e}")
-        raise HTTPException(status_code=500, detail="Database connection failed")
+        cur = conn.cursor(cursor_factory=cursor_factory)
+        try:
+            yield cur
+        finally:
+            cur.close()
+    finally:
+        try:
+            conn.rollback()
+        except psycopg2.Error:
+            pass
+        put_db_connection(conn)
+
+# Server-side prepared statements for the fixed-shape hot queries, so
+# PostgreSQL parses and plans them once per pooled session instead of on
+# every call. EXECUTE-first-and-prepare-on-miss avoids having to track
+# which pooled connection has already seen which statement.
+_PREPARED_QUERIES = {
+    'player_by_id': """
+        SELECT id, name, age, weight, height, COALESCE(NULLIF(sport, ''), 'Unknown') AS sport, country, position, team, source, player_url, created_at, updated_at
+        FROM players WHERE id = $1
+    """,
+    'recent_logs': """
+        SELECT id, error_message, player_url, timestamp
+        FROM rugby_logs
+        ORDER BY timestamp DESC
+        LIMIT $1
+    """,
+}
+
+def execute_prepared(cur, name, params):
+    execute_sql = "EXECUTE {}({})".format(name, ", ".join(["%s"] * len(params)))
+    try:
+        cur.execute(execute_sql, params)
+    except psycopg2.errors.InvalidSqlStatementName:
+        # Not prepared on this session yet - prepare and retry
+        cur.connection.rollback()
+        cur.execute("PREPARE {} AS {}".format(name, _PREPARED_QUERIES[name]))
+        cur.execute(execute_sql, params)
+    except psycopg2.errors.FeatureNotSupportedError:
+        # A schema change invalidated the cached plan - drop and re-prepare
+        # just this statement; DEALLOCATE ALL would evict the other hot
+        # statements on the session and force them back down the miss path
+        cur.connection.rollback()
+        cur.execute("DEALLOCATE {}; PREPARE {} AS {}".format(name, name, _PREPARED_QUERIES[name]))
+        cur.execute(execute_sql, params)
+
+# Schema DDL, sent to the server as one statement batch - startup used to
+# pay a round-trip per CREATE, which adds up on a remote database
+_INIT_DB_DDL = """
+    CREATE TABLE IF NOT EXISTS players (
+        id SERIAL PRIMARY KEY,
+        name TEXT NOT NULL,
+        age INTEGER,
+        weight TEXT,
+        height TEXT,
+        sport TEXT, -- Removed DEFAULT 'Rugby' to allow NULL
+        country TEXT,
+        position TEXT,
+        team TEXT,
+        source TEXT, -- Removed DEFAULT 'all.rugby'
+        player_url TEXT UNIQUE,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Logs table for error tracking
+    CREATE TABLE IF NOT EXISTS rugby_logs (
+        id SERIAL PRIMARY KEY,
+        error_message TEXT,
+        player_url TEXT,
+        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Indexes backing the /players filters and the sport reconcile pass;
+    -- without them every filtered request seq-scans the whole table
+    CREATE INDEX IF NOT EXISTS idx_players_source ON players(source);
+    CREATE INDEX IF NOT EXISTS idx_players_sport ON players(sport);
+    CREATE INDEX IF NOT EXISTS idx_players_country_team ON players(country, team);
+    CREATE INDEX IF NOT EXISTS idx_players_position ON players(position);
+    -- Partial index for the reconcile pass: rows still missing a sport
+    CREATE INDEX IF NOT EXISTS idx_players_sport_null ON players(source) WHERE sport IS NULL;
+
+    -- Covering indexes for the two hottest /players sort keys: the sort is
+    -- served by an index range scan, and the INCLUDEd columns spare heap
+    -- fetches for the filters evaluated alongside it. (name, id) also backs
+    -- the keyset cursor.
+    CREATE INDEX IF NOT EXISTS idx_players_name_id ON players(name, id) INCLUDE (sport, country, team, position);
+    CREATE INDEX IF NOT EXISTS idx_players_age ON players(age) INCLUDE (name, sport, country) WHERE age IS NOT NULL;
+"""
+
+# Materialized stats backing /stats: the aggregates are recomputed once
+# per scrape run (see refresh_players_stats) instead of on every request.
+# The unique index is what allows REFRESH ... CONCURRENTLY.
+_PLAYERS_STATS_DDL = """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS players_stats AS
+    SELECT
+        1 AS id,
+        (SELECT COUNT(*) FROM players) AS total_players,
+        (SELECT COUNT(DISTINCT country) FROM players WHERE country IS NOT NULL) AS total_countries,
+        (SELECT COUNT(DISTINCT team) FROM players WHERE team IS NOT NULL) AS total_teams,
+        (SELECT COUNT(DISTINCT position) FROM players WHERE position IS NOT NULL) AS total_positions,
+        (SELECT AVG(age) FROM players WHERE age IS NOT NULL) AS average_age,
+        (SELECT COALESCE(json_agg(t), '[]'::json) FROM (
+            SELECT country, COUNT(*) AS count
+            FROM players
+            WHERE country IS NOT NULL
+            GROUP BY country
+            ORDER BY count DESC
+            LIMIT 10
+        ) t) AS top_countries;
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_players_stats_id ON players_stats(id);
+"""
 
 # Initialize database tables
 def init_db():
     try:
-        conn = psycopg2.connect(**db_params)
+        conn = _get_pool().getconn()
         cur = conn.cursor()
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS players (
-                id SERIAL PRIMARY KEY,
-                name TEXT NOT NULL,
-                age INTEGER,
-                weight TEXT,
-                height TEXT,
-                sport TEXT, -- Removed DEFAULT 'Rugby' to allow NULL
-                country TEXT,
-                position TEXT,
-                team TEXT,
-                source TEXT, -- Removed DEFAULT 'all.rugby'
-                player_url TEXT UNIQUE,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-        """)
-        
-        # Create logs table for error tracking
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS rugby_logs ( 
-                id SERIAL PRIMARY KEY,
-                error_message TEXT,
-                player_url TEXT,
-                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-        """)
-        
+        cur.execute(_INIT_DB_DDL)
         conn.commit()
         logger.info("Database tables initialized successfully.")
+
+        # Trigram index lets the name ILIKE '%...%' search use an index.
+        # pg_trgm needs the extension installed, which may require privileges
+        # we don't have - treat failure as non-fatal.
+        try:
+            cur.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+            cur.execute("CREATE INDEX IF NOT EXISTS idx_players_name_trgm ON players USING gin (name gin_trgm_ops);")
+            conn.commit()
+        except psycopg2.Error as e:
+            conn.rollback()
+            logger.warning(f"pg_trgm name index not created: {e}")
+
+        # Best-effort like the trgm index: /stats falls back to live
+        # aggregates if the view is missing
+        try:
+            cur.execute(_PLAYERS_STATS_DDL)
+            conn.commit()
+        except psycopg2.Error as e:
+            conn.rollback()
+            logger.warning(f"players_stats view not created: {e}")
     except psycopg2.Error as e:
         logger.error(f"Database initialization failed: {e}")
         raise
@@ -170,37 +373,90 @@ def init_db():
         if 'cur' in locals():
             cur.close()
         if 'conn' in locals():
-            conn.close()
-
-# Log error to database
-def log_error(error_message, player_url=None):
+            put_db_connection(conn)
+
+# Error rows are queued and COPYed in batches by a background thread.
+# During an incident (site outage) thousands of errors cascade, and a
+# connection + single-row INSERT per error made logging itself the
+# bottleneck.
+_error_queue = queue.Queue()
+_ERROR_FLUSH_INTERVAL = 2.0  # seconds
+_ERROR_FLUSH_SIZE = 500
+_error_writer_started = False
+_error_writer_lock = threading.Lock()
+
+def _flush_error_rows(rows):
     try:
-        conn = psycopg2.connect(**db_params)
+        conn = _get_pool().getconn()
         cur = conn.cursor()
-        cur.execute("""
-            INSERT INTO rugby_logs (error_message, player_url)
-            VALUES (%s, %s);
-        """, (str(error_message), player_url))
+        cur.copy_expert(
+            "COPY rugby_logs (error_message, player_url) FROM STDIN WITH CSV",
+            _RowStream(rows)
+        )
         conn.commit()
-        
-        # Also add to global status
-        global scraping_status
-        scraping_status['errors'].append(f"{datetime.now()}: {error_message}")
-        # Keep only last 10 errors
-        if len(scraping_status['errors']) > 10:
-            scraping_status['errors'] = scraping_status['errors'][-10:]
-            
-    except psycopg2.Error as e:
-        logger.error(f"Failed to log error to database: {e}")
+    except Exception as e:
+        if 'conn' in locals():
+            try:
+                conn.rollback()
+            except psycopg2.Error:
+                pass  # connection died mid-COPY; putconn discards it
+        logger.error(f"Failed to log {len(rows)} errors to database: {e}")
     finally:
         if 'cur' in locals():
             cur.close()
         if 'conn' in locals():
-            conn.close()
+            put_db_connection(conn)
+
+def _error_writer():
+    while True:
+        rows = [_error_queue.get()]
+        deadline = time.monotonic() + _ERROR_FLUSH_INTERVAL
+        while len(rows) < _ERROR_FLUSH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                rows.append(_error_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        # The writer must outlive any single bad flush: if it dies the
+        # queue has no consumer and grows unbounded for the process life
+        try:
+            _flush_error_rows(rows)
+        except Exception as e:
+            logger.error(f"Error writer: dropping {len(rows)} rows: {e}")
+
+def _ensure_error_writer():
+    global _error_writer_started
+    with _error_writer_lock:
+        if not _error_writer_started:
+            threading.Thread(target=_error_writer, daemon=True).start()
+            _error_writer_started = True
+
+# Log error to database (queued; written in batches by _error_writer)
+def log_error(error_message, player_url=None):
+    _ensure_error_writer()
+    _error_queue.put((str(error_message), player_url))
+
+    # Also add to global status
+    global scraping_status
+    with _status_lock:
+        # deque(maxlen=10) discards the oldest entry itself
+        scraping_status['errors'].append(f"{datetime.now()}: {error_message}")
 
 # Selenium setup (for all.rugby and ultimate.rugby) - Kept as is from previous turn
 def setup_driver():
     options = Options()
+    # DOMContentLoaded is enough for text scraping - don't block driver.get()
+    # on images/fonts/trackers finishing
+    options.page_load_strategy = 'eager'
+    # Skip downloading content we never read
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.stylesheets": 2,
+        "profile.managed_default_content_settings.fonts": 2
+    })
+    options.add_argument('--blink-settings=imagesEnabled=false')
     options.add_argument('--headless')
     options.add_argument('--no-sandbox')
     options.add_argument('--disable-dev-shm-usage')
@@ -217,9 +473,13 @@ def setup_driver():
     options.add_argument("--disable-logging")
     
     try:
-        service = Service(ChromeDriverManager().install())
+        # Resolved once and cached (CHROMEDRIVER_PATH env, then on-disk cache,
+        # then webdriver_manager) - the driver pool calls setup_driver N times
+        # at startup and a fresh install() lookup each time adds seconds
+        service = Service(get_chromedriver_path())
         service.log_path = os.devnull
-        driver = webdriver.Chrome(service=service, options=options)
+        # keep_alive reuses the HTTP connection to chromedriver across commands
+        driver = webdriver.Chrome(service=service, options=options, keep_alive=True)
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         driver.set_page_load_timeout(60)
         driver.implicitly_wait(10)
@@ -229,14 +489,85 @@ def setup_driver():
         logger.error(f"Error initializing WebDriver: {e}")
         raise
 
-# Extract player info from bio section (for all.rugby) - Kept as is from previous turn
-def extract_from_bio_all_rugby(driver):
+ALL_RUGBY_BASE = "https://all.rugby"
+
+# Compiled once - these run for every scraped all.rugby player
+_RE_H1 = re.compile(r"(.+?)\s+(\d+)\s+years,\s+(.+)")
+_RE_HEIGHT = re.compile(r'[Ss]tanding at ([0-9.]+) ?m')
+_RE_WEIGHT = re.compile(r'[Ww]eighing in at (\d+)')
+_RE_TEAM = re.compile(r'currently plays for (.+?) in')
+_RE_COUNTRY = re.compile(r'([A-Z][a-z]+) rugby player')
+
+# HTTP variants for all.rugby - the pages are server-rendered, so a plain
+# GET parsed with BeautifulSoup avoids the browser entirely. The Selenium
+# versions below stay as the fallback.
+def get_all_rugby_team_urls_http(session):
+    html = fetch_page(session, f"{ALL_RUGBY_BASE}/players/")
+    if html is None:
+        return []
+    soup = BeautifulSoup(html, 'html.parser')
+    team_urls = set()
+    for link in soup.select('div[class*="bloc dra"] a[href], div[class*="bloc clbb"] a[href]'):
+        team_urls.add(urllib.parse.urljoin(ALL_RUGBY_BASE, link['href']))
+    logger.info(f"Found {len(team_urls)} all.rugby team URLs over HTTP")
+    return list(team_urls)
+
+def get_player_urls_from_all_rugby_team_http(session, team_url):
+    html = fetch_page(session, team_url)
+    if html is None:
+        return []
+    soup = BeautifulSoup(html, 'html.parser')
+    player_urls = {
+        urllib.parse.urljoin(ALL_RUGBY_BASE, link['href'])
+        for link in soup.select('a[href^="/player/"]')
+    }
+    logger.info(f"Found {len(player_urls)} players in all.rugby team {team_url}")
+    return list(player_urls)
+
+def scrape_all_rugby_player_http(session, url):
     try:
-        container = driver.find_element(By.CSS_SELECTOR, 'div.pas')
-        bio_section = container.find_element(By.CSS_SELECTOR, 'div.bio')
-        bio_text = bio_section.text.strip()
+        html = fetch_page(session, url)
+        if html is None:
+            return None
+        soup = BeautifulSoup(html, 'html.parser')
+
+        h1_element = soup.select_one('h1.inbl')
+        if h1_element is None:
+            raise ValueError("h1.inbl not found")
+        h1_text = h1_element.get_text().strip()
+        match = _RE_H1.match(h1_text)
+        if match:
+            name = match.group(1).strip()
+            age = int(match.group(2))
+            position = match.group(3).strip()
+        else:
+            name = h1_text
+            age = None
+            position = None
 
-        height_match = re.search(r'[Ss]tanding at ([0-9.]+) ?m', bio_text)
+        bio_element = soup.select_one('div.pas div.bio')
+        bio = extract_from_bio_all_rugby(bio_element.get_text().strip() if bio_element else '')
+        return {
+            'name': name,
+            'age': age,
+            'weight': bio.get('weight'),
+            'height': bio.get('height'),
+            'sport': 'Rugby', # Explicitly set sport for all.rugby
+            'country': bio.get('country'),
+            'position': position,
+            'team': bio.get('team'),
+            'source': 'all.rugby',
+            'player_url': url
+        }
+    except Exception as e:
+        logger.warning(f"Failed to scrape all.rugby player {url}: {e}")
+        log_error(f"Failed to scrape all.rugby player {url}: {e}", url)
+        return None
+
+# Extract player info from bio text (for all.rugby)
+def extract_from_bio_all_rugby(bio_text):
+    try:
+        height_match = _RE_HEIGHT.search(bio_text)
         if height_match:
             height_m = float(height_match.group(1))
             total_inches = int(round(height_m * 39.3701)) 
@@ -246,13 +577,13 @@ def extract_from_bio_all_rugby(driver):
         else:
             height = None
 
-        weight_match = re.search(r'[Ww]eighing in at (\d+)', bio_text)
+        weight_match = _RE_WEIGHT.search(bio_text)
         weight = weight_match.group(1) if weight_match else None # Store just the number
 
-        team_match = re.search(r'currently plays for (.+?) in', bio_text)
+        team_match = _RE_TEAM.search(bio_text)
         team = team_match.group(1).strip() if team_match else None
 
-        country_match = re.search(r'([A-Z][a-z]+) rugby player', bio_text)
+        country_match = _RE_COUNTRY.search(bio_text)
         country = country_match.group(1).strip() if country_match else None
 
         return {
@@ -269,27 +600,30 @@ def extract_from_bio_all_rugby(driver):
 def get_all_rugby_team_urls(driver):
     try:
         driver.get("https://all.rugby/players/")
-        time.sleep(3)
-
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(3)
-
-        team_urls = []
-        nation_links = driver.find_elements(By.XPATH, '//div[contains(@class, "bloc dra")]/a')
-        for link in nation_links:
-            href = link.get_attribute("href")
-            if href:
-                team_urls.append(href)
-
-        club_links = driver.find_elements(By.XPATH, '//div[contains(@class, "bloc clbb")]/a')
-        for link in club_links:
-            href = link.get_attribute("href")
-            if href:
-                team_urls.append(href)
-
-        unique_urls = list(set(team_urls))
-        logger.info(f"Found {len(unique_urls)} all.rugby team URLs")
-        return unique_urls
+        # Wait for the listing to actually render rather than a flat 3s
+        WebDriverWait(driver, 10).until(
+            lambda d: len(d.find_elements(By.XPATH, '//div[contains(@class, "bloc dra")]/a')) > 0)
+
+        # Scroll until the page height stops growing (lazy-loaded blocks),
+        # polling instead of sleeping a fixed 3s after one scroll
+        last_height = driver.execute_script("return document.body.scrollHeight;")
+        for _ in range(10):
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            time.sleep(0.3)
+            new_height = driver.execute_script("return document.body.scrollHeight;")
+            if new_height == last_height:
+                break
+            last_height = new_height
+
+        # One script call returns every nation and club href at once - the
+        # per-link get_attribute loop cost a WebDriver round-trip each
+        hrefs = driver.execute_script(
+            'return Array.from(document.querySelectorAll('
+            '\'div[class*="bloc dra"] a[href], div[class*="bloc clbb"] a[href]\''
+            ')).map(a => a.href);')
+        team_urls = {href for href in hrefs if href}
+        logger.info(f"Found {len(team_urls)} all.rugby team URLs")
+        return list(team_urls)
     except Exception as e:
         logger.error(f"Failed to get all.rugby team URLs: {e}")
         log_error(f"Failed to get all.rugby team URLs: {e}")
@@ -300,8 +634,11 @@ def get_player_urls_from_all_rugby_team(driver, team_url):
     try:
         driver.get(team_url)
         WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, 'a[href^="/player/"]')))
-        links = driver.find_elements(By.CSS_SELECTOR, 'a[href^="/player/"]')
-        player_urls = [link.get_attribute("href") for link in links if '/player/' in link.get_attribute('href')]
+        # One script call returns every href at once - per-link get_attribute
+        # would cost a WebDriver round-trip each
+        player_urls = driver.execute_script(
+            'return Array.from(document.querySelectorAll(\'a[href^="/player/"]\')).map(a => a.href);')
+        player_urls = [href for href in player_urls if href and '/player/' in href]
         logger.info(f"Found {len(player_urls)} players in all.rugby team {team_url}")
         return player_urls
     except Exception as e:
@@ -315,8 +652,17 @@ def scrape_all_rugby_player(driver, url):
         driver.get(url)
         WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, 'div.pas')))
 
-        h1_text = driver.find_element(By.CSS_SELECTOR, "h1.inbl").text.strip()
-        match = re.match(r"(.+?)\s+(\d+)\s+years,\s+(.+)", h1_text)
+        # Pull everything the parsers need in one round-trip
+        page_data = driver.execute_script("""
+            var h1 = document.querySelector('h1.inbl');
+            var bio = document.querySelector('div.pas div.bio');
+            return {h1: h1 ? h1.innerText : null, bio: bio ? bio.innerText : null};
+        """)
+        if not page_data or not page_data.get('h1'):
+            raise NoSuchElementException("h1.inbl not found")
+
+        h1_text = page_data['h1'].strip()
+        match = _RE_H1.match(h1_text)
         if match:
             name = match.group(1).strip()
             age = int(match.group(2))
@@ -326,7 +672,7 @@ def scrape_all_rugby_player(driver, url):
             age = None
             position = None
 
-        bio = extract_from_bio_all_rugby(driver) # Use specific bio extractor
+        bio = extract_from_bio_all_rugby((page_data.get('bio') or '').strip()) # Use specific bio extractor
         return {
             'name': name,
             'age': age,
@@ -344,98 +690,191 @@ def scrape_all_rugby_player(driver, url):
         log_error(f"Failed to scrape all.rugby player {url}: {e}", url)
         return None
 
-# Insert player data into database
-def insert_player(data: Dict[str, Any]):
+# Buffered player writes: rows accumulate here and hit the DB as one COPY
+# into a staging table plus one upsert per batch, instead of one
+# connection + INSERT + commit per row.
+_FLUSH_SIZE = 1000
+_insert_buffer: List[tuple] = []
+_insert_buffer_lock = threading.Lock()
+
+_STAGE_UPSERT_SQL = """
+    INSERT INTO players (name, age, weight, height, sport, country, position, team, source, player_url)
+    SELECT DISTINCT ON (player_url) name, age, weight, height, sport, country, position, team, source, player_url
+    FROM players_stage
+    ON CONFLICT (player_url) DO UPDATE SET
+        name = EXCLUDED.name,
+        age = COALESCE(EXCLUDED.age, players.age),
+        weight = COALESCE(EXCLUDED.weight, players.weight),
+        height = COALESCE(EXCLUDED.height, players.height),
+        sport = EXCLUDED.sport, -- This will update to 'Basketball'/'Athletics' or 'Rugby' or NULL as provided
+        country = COALESCE(EXCLUDED.country, players.country),
+        position = COALESCE(EXCLUDED.position, players.position),
+        team = COALESCE(EXCLUDED.team, players.team),
+        source = EXCLUDED.source,
+        updated_at = CURRENT_TIMESTAMP;
+"""
+
+class _RowStream(io.RawIOBase):
+    """File-like view over rows, CSV-encoded on demand.
+
+    copy_expert pulls from this in fixed-size reads, so COPY streams the
+    batch with O(1) memory instead of materializing the whole payload in
+    a StringIO first."""
+
+    def __init__(self, rows):
+        self._chunks = self._encode(rows)
+        self._leftover = b""
+
+    @staticmethod
+    def _encode(rows):
+        sink = io.StringIO()
+        writer = csv.writer(sink)
+        for row in rows:
+            writer.writerow(row)
+            yield sink.getvalue().encode()
+            sink.seek(0)
+            sink.truncate()
+
+    def readable(self):
+        return True
+
+    def readinto(self, buf):
+        while len(self._leftover) < len(buf):
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._leftover += chunk
+        n = min(len(buf), len(self._leftover))
+        buf[:n] = self._leftover[:n]
+        self._leftover = self._leftover[n:]
+        return n
+
+def flush_players():
+    """Flush buffered player rows: COPY into a temp staging table, then one
+    INSERT ... SELECT ... ON CONFLICT preserving the per-column COALESCE
+    upsert semantics. DISTINCT ON guards against the same player_url
+    appearing twice in one batch, which ON CONFLICT would reject."""
+    with _insert_buffer_lock:
+        rows = list(_insert_buffer)
+        _insert_buffer.clear()
+    if not rows:
+        return
+
     try:
-        conn = psycopg2.connect(**db_params)
+        conn = _get_pool().getconn()
         cur = conn.cursor()
+        cur.execute("CREATE TEMP TABLE players_stage (LIKE players INCLUDING DEFAULTS) ON COMMIT DROP;")
+        cur.copy_expert(
+            "COPY players_stage (name, age, weight, height, sport, country, position, team, source, player_url) FROM STDIN WITH CSV",
+            _RowStream(rows)
+        )
+        cur.execute(_STAGE_UPSERT_SQL)
+        conn.commit()
+        logger.info(f"Flushed {len(rows)} players to database")
+    except Exception as e:
+        if 'conn' in locals():
+            conn.rollback()
+        logger.error(f"DB Error flushing {len(rows)} players: {e}", exc_info=True)
+        log_error(f"DB Error flushing players batch: {e}")
+    finally:
+        if 'cur' in locals():
+            cur.close()
+        if 'conn' in locals():
+            put_db_connection(conn)
 
+# Insert player data into database (buffered; see flush_players)
+def insert_player(data: Dict[str, Any]):
+    try:
         # Explicitly handle sport and source to allow NULL in DB if not provided,
         # or use a generic 'Unknown' for display.
         # For DB insertion, pass None if no sport/source is specifically set by the scraper.
         sport_to_insert = data.get('sport') # Will be None if key doesn't exist
         source_to_insert = data.get('source') # Will be None if key doesn't exist
-        
-        cur.execute("""
-            INSERT INTO players (name, age, weight, height, sport, country, position, team, source, player_url)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (player_url) DO UPDATE SET
-                name = EXCLUDED.name,
-                age = COALESCE(EXCLUDED.age, players.age),
-                weight = COALESCE(EXCLUDED.weight, players.weight),
-                height = COALESCE(EXCLUDED.height, players.height),
-                sport = EXCLUDED.sport, -- This will update to 'Basketball'/'Athletics' or 'Rugby' or NULL as provided
-                country = COALESCE(EXCLUDED.country, players.country),
-                position = COALESCE(EXCLUDED.position, players.position),
-                team = COALESCE(EXCLUDED.team, players.team),
-                source = EXCLUDED.source,
-                updated_at = CURRENT_TIMESTAMP;
-        """, (
+
+        row = (
             data['name'], data.get('age'), data.get('weight'), data.get('height'),
             sport_to_insert, data.get('country'), data.get('position'), data.get('team'),
             source_to_insert, data['player_url']
-        ))
-        conn.commit()
-        logger.info(f"Saved: {data['name']} (Sport: {sport_to_insert}, Source: {source_to_insert})")
+        )
+        with _insert_buffer_lock:
+            _insert_buffer.append(row)
+            should_flush = len(_insert_buffer) >= _FLUSH_SIZE
+        if should_flush:
+            flush_players()
+        logger.debug(f"Buffered: {data['name']} (Sport: {sport_to_insert}, Source: {source_to_insert})")
         return True
     except Exception as e:
         logger.error(f"DB Error: {e}", exc_info=True)
         logger.debug(f"Failed Data: {json.dumps(data, indent=2)}")
         log_error(f"DB Error inserting {data.get('name', 'Unknown')}: {e}", data.get('player_url'))
         return False
+
+# --- MODIFIED Sport Fixing Function ---
+# Known source → sport mapping for the reconcile pass. The insert path
+# already sets sport inline, so this normally touches few rows.
+_SOURCE_SPORTS = [
+    ('basketball.afrobasket.com', 'Basketball'),
+    ('basketball.australiabasket.com', 'Basketball'),
+    ('basketball.eurobasket.com', 'Basketball'),
+    ('basketball.asia-basket.com', 'Basketball'),
+    ('basketball.usbasket.com', 'Basketball'),
+    ('basketball.latinbasket.com', 'Basketball'),
+    ('all.rugby', 'Rugby'),
+    ('ultimaterugby.com', 'Rugby'),
+    ('rugbypass.com', 'Rugby'),
+    ('worldathletics.org', 'Athletics'),
+]
+
+def refresh_players_stats():
+    """Recompute the players_stats materialized view after a scrape run.
+    CONCURRENTLY keeps /stats readable during the refresh but cannot run
+    inside a transaction, hence the autocommit toggle."""
+    try:
+        conn = _get_pool().getconn()
+        conn.autocommit = True
+        cur = conn.cursor()
+        cur.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY players_stats;")
+    except Exception as e:
+        logger.warning(f"players_stats refresh failed: {e}")
     finally:
         if 'cur' in locals():
             cur.close()
         if 'conn' in locals():
-            conn.close()
+            conn.autocommit = False
+            put_db_connection(conn)
 
-# --- MODIFIED Sport Fixing Function ---
-def fix_sport_columns_after_scrape():
+def analyze_players():
+    """Refresh planner statistics after a bulk load, so the query planner
+    trusts the /players indexes instead of stale row estimates."""
     try:
-        conn = psycopg2.connect(**db_params)
+        conn = _get_pool().getconn()
         cur = conn.cursor()
+        cur.execute("ANALYZE players;")
+        conn.commit()
+    except Exception as e:
+        logger.warning(f"ANALYZE players failed: {e}")
+    finally:
+        if 'cur' in locals():
+            cur.close()
+        if 'conn' in locals():
+            put_db_connection(conn)
 
-        # Define all known sources and their sports
-        basketball_sources = [
-            'basketball.afrobasket.com',
-            'basketball.australiabasket.com',
-            'basketball.eurobasket.com',
-            'basketball.asia-basket.com',
-            'basketball.usbasket.com',
-            'basketball.latinbasket.com'
-        ]
-        rugby_sources = [
-            'all.rugby',
-            'ultimaterugby.com',
-            'rugbypass.com' # Uncomment if you enable rugbypass scraper
-        ]
-        athletics_sources = [
-            'worldathletics.org' # Uncomment if you enable worldathletics scraper
-        ]
-
-        # Update Basketball sports
-        cur.execute("""
-            UPDATE players
-            SET sport = 'Basketball'
-            WHERE source IN %s AND (sport IS NULL OR sport != 'Basketball');
-        """, (tuple(basketball_sources),))
-        logger.info(f"✔️ Fixed sport column for basketball websites. Rows updated: {cur.rowcount}")
-
-        # Update Rugby sports
-        cur.execute("""
-            UPDATE players
-            SET sport = 'Rugby'
-            WHERE source IN %s AND (sport IS NULL OR sport != 'Rugby');
-        """, (tuple(rugby_sources),))
-        logger.info(f"✔️ Fixed sport column for rugby websites. Rows updated: {cur.rowcount}")
+def fix_sport_columns_after_scrape():
+    try:
+        conn = _get_pool().getconn()
+        cur = conn.cursor()
 
-        # Update Athletics sports
-        cur.execute("""
+        # One statement joined against the mapping, updating only rows whose
+        # sport actually disagrees - three full-table UPDATEs before, each
+        # rewriting matching heap pages, collapsed into O(dirty rows)
+        execute_values(cur, """
             UPDATE players
-            SET sport = 'Athletics'
-            WHERE source IN %s AND (sport IS NULL OR sport != 'Athletics');
-        """, (tuple(athletics_sources),))
-        logger.info(f"✔️ Fixed sport column for athletics websites. Rows updated: {cur.rowcount}")
+            SET sport = v.sport
+            FROM (VALUES %s) AS v(source, sport)
+            WHERE players.source = v.source
+              AND players.sport IS DISTINCT FROM v.sport;
+        """, _SOURCE_SPORTS)
+        logger.info(f"✔️ Reconciled sport column. Rows updated: {cur.rowcount}")
 
         conn.commit()
     except Exception as e:
@@ -444,8 +883,75 @@ def fix_sport_columns_after_scrape():
         if 'cur' in locals():
             cur.close()
         if 'conn' in locals():
-            conn.close()
+            put_db_connection(conn)
+
+
+class HostLimiter:
+    """Per-host minimum-interval gate for parallel scrapers.
+
+    A flat time.sleep(1) in each worker serializes requests even across
+    different hosts. This sleeps only as long as needed to keep requests
+    to the *same* host min_interval apart, letting different hosts (and
+    already-spaced requests) proceed immediately.
+    """
+
+    def __init__(self, min_interval=1.0):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._last = {}  # netloc -> last request timestamp (monotonic)
 
+    def wait(self, url):
+        host = urllib.parse.urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            pause = self._last.get(host, 0) + self.min_interval - now
+            # Reserve the slot before sleeping so other workers queue behind it
+            self._last[host] = max(now, now + pause)
+        if pause > 0:
+            time.sleep(pause)
+
+_host_limiter = HostLimiter(min_interval=1.0)
+
+# Team-level parallelism for All.Rugby: teams are independent, so each
+# worker borrows a driver from the pool, processes one team end to end,
+# and returns the driver for the next team
+_ALL_RUGBY_WORKERS = 4
+
+def _process_all_rugby_team_http(session, team_url):
+    if not scraping_status['is_running']:
+        return 0
+    player_urls = get_player_urls_from_all_rugby_team_http(session, team_url)
+    processed = 0
+    for player_url in player_urls:
+        if not scraping_status['is_running']:
+            break
+        _host_limiter.wait(player_url) # Rate limiting, per host
+        data = scrape_all_rugby_player_http(session, player_url)
+        if data:
+            # scrape_all_rugby_player_http already sets 'sport': 'Rugby' and 'source': 'all.rugby'
+            if insert_player(data):
+                processed += 1
+    return processed
+
+def _process_all_rugby_team(driver_pool, team_url):
+    if not scraping_status['is_running']:
+        return 0
+    driver = driver_pool.get()
+    try:
+        player_urls = get_player_urls_from_all_rugby_team(driver, team_url)
+        processed = 0
+        for player_url in player_urls:
+            if not scraping_status['is_running']:
+                break
+            _host_limiter.wait(player_url) # Rate limiting, per host
+            data = scrape_all_rugby_player(driver, player_url)
+            if data:
+                # scrape_all_rugby_player already explicitly sets 'sport': 'Rugby' and 'source': 'all.rugby'
+                if insert_player(data):
+                    processed += 1
+        return processed
+    finally:
+        driver_pool.put(driver)
 
 # Background scraping function
 def scrape_all_background():
@@ -457,7 +963,8 @@ def scrape_all_background():
     scraping_status['current_item'] = ''
     scraping_status['total_items'] = 0
     scraping_status['start_time'] = datetime.now()
-    scraping_status['errors'] = []
+    scraping_status['errors'] = deque(maxlen=10)
+    _notify_status_change()
     
     driver = None # Initialize driver here, to be shared by Selenium-based scrapers
     try:
@@ -570,35 +1077,68 @@ def scrape_all_background():
             scraping_status['current_item'] = 'Initializing All.Rugby Scraper...'
             logger.info("➡️ Running All.Rugby scraper...")
             
-            # The driver is already initialized at the start of scrape_all_background
-            team_urls = get_all_rugby_team_urls(driver) # Uses the shared driver
-            scraping_status['total_items'] = len(team_urls)
-            
-            for i, team_url in enumerate(team_urls):
-                if not scraping_status['is_running']: 
-                    logger.info("All.Rugby scraping stopped by user.")
-                    break
-                    
-                scraping_status['current_item'] = f"Team {i+1}/{len(team_urls)} (All.Rugby): {team_url}"
-                logger.info(f"Processing team {i+1}/{len(team_urls)} (All.Rugby): {team_url}")
-                
-                player_urls = get_player_urls_from_all_rugby_team(driver, team_url) # Uses the shared driver
-                
-                for j, player_url in enumerate(player_urls):
-                    if not scraping_status['is_running']: 
-                        logger.info("All.Rugby player scraping stopped by user.")
-                        break
-                        
-                    scraping_status['current_item'] = f"Player {j+1}/{len(player_urls)} from {team_url} (All.Rugby)"
-                    data = scrape_all_rugby_player(driver, player_url) # Uses the shared driver
-                    if data:
-                        # scrape_all_rugby_player already explicitly sets 'sport': 'Rugby' and 'source': 'all.rugby'
-                        if insert_player(data): 
-                            scraping_status['processed'] += 1
-                    time.sleep(1) # Rate limiting
-                
-                time.sleep(2) # Rate limiting between teams
-            
+            # HTTP first: all.rugby is server-rendered, so a requests session
+            # avoids the browser entirely. Selenium stays as the fallback.
+            session = make_session()
+            team_urls = get_all_rugby_team_urls_http(session)
+
+            if team_urls:
+                scraping_status['total_items'] = len(team_urls)
+                with ThreadPoolExecutor(max_workers=_ALL_RUGBY_WORKERS) as executor:
+                    futures = {
+                        executor.submit(_process_all_rugby_team_http, session, team_url): team_url
+                        for team_url in team_urls
+                    }
+                    for i, future in enumerate(as_completed(futures), start=1):
+                        team_url = futures[future]
+                        scraping_status['current_item'] = f"Team {i}/{len(team_urls)} (All.Rugby): {team_url}"
+                        logger.info(f"Finished team {i}/{len(team_urls)} (All.Rugby): {team_url}")
+                        try:
+                            scraping_status['processed'] += future.result()
+                        except Exception as e:
+                            logger.error(f"All.Rugby team {team_url} failed: {e}")
+                            log_error(f"All.Rugby team {team_url} failed: {e}")
+            else:
+                logger.info("All.Rugby not usable over plain HTTP, falling back to Selenium")
+                # The driver is already initialized at the start of scrape_all_background
+                team_urls = get_all_rugby_team_urls(driver) # Uses the shared driver
+                scraping_status['total_items'] = len(team_urls)
+
+                # Driver pool shared by the team workers; the driver created
+                # above joins the pool so it isn't idle during this phase
+                driver_pool = queue.Queue()
+                driver_pool.put(driver)
+                extra_drivers = []
+                for _ in range(_ALL_RUGBY_WORKERS - 1):
+                    try:
+                        extra = setup_driver()
+                        extra_drivers.append(extra)
+                        driver_pool.put(extra)
+                    except Exception as e:
+                        logger.warning(f"Could not start extra All.Rugby driver: {e}")
+
+                try:
+                    with ThreadPoolExecutor(max_workers=_ALL_RUGBY_WORKERS) as executor:
+                        futures = {
+                            executor.submit(_process_all_rugby_team, driver_pool, team_url): team_url
+                            for team_url in team_urls
+                        }
+                        for i, future in enumerate(as_completed(futures), start=1):
+                            team_url = futures[future]
+                            scraping_status['current_item'] = f"Team {i}/{len(team_urls)} (All.Rugby): {team_url}"
+                            logger.info(f"Finished team {i}/{len(team_urls)} (All.Rugby): {team_url}")
+                            try:
+                                scraping_status['processed'] += future.result()
+                            except Exception as e:
+                                logger.error(f"All.Rugby team {team_url} failed: {e}")
+                                log_error(f"All.Rugby team {team_url} failed: {e}")
+                finally:
+                    for extra in extra_drivers:
+                        try:
+                            extra.quit()
+                        except Exception:
+                            pass
+
             logger.info("✅ All.Rugby scraper completed.")
 
         # === BasketUSA ===
@@ -623,18 +1163,24 @@ def scrape_all_background():
 
 
         # --- Final sport column fixes as a safety net ---
+        flush_players() # Push any buffered rows before the reconcile pass
         fix_sport_columns_after_scrape() # Call this once after all scraping is done
-        
+        analyze_players() # Refresh planner stats so the new rows hit the indexes
+        refresh_players_stats() # Recompute the /stats aggregates once, not per request
+
     except Exception as e:
         logger.error(f"Global scraping error: {e}", exc_info=True)
         log_error(f"Global scraping error: {e}")
     finally:
+        flush_players() # Don't lose buffered rows on errors or stop requests
         if driver:
             driver.quit() # Ensure shared driver is closed
         scraping_status['is_running'] = False
         scraping_status['current_sport'] = 'Completed'
         scraping_status['current_item'] = ''
         scraping_status['total_items'] = 0
+        invalidate_api_caches() # Newly scraped data should show up immediately
+        _notify_status_change()
 
 
 # ==================== API ENDPOINTS ====================
@@ -646,18 +1192,33 @@ def startup_event():
     
     # Schedule periodic scraping every 5 days
     scheduler.add_job(scrape_all_background, 'interval', days=5, id='full_scrape_job', max_instances=1) # max_instances to prevent overlapping runs
+
+    # Run the first scrape through the scheduler too instead of an ad-hoc
+    # thread, so it shares the scheduler's worker pool and shows up in its
+    # job listing alongside the interval job
+    scheduler.add_job(scrape_all_background, 'date', run_date=datetime.now(), id='initial_scrape_job')
     scheduler.start()
-    
-    # Run the first scrape on startup in a separate thread
-    threading.Thread(target=scrape_all_background, daemon=True).start()
 
 @app.get("/", summary="API Health Check")
 async def root():
     """Health check endpoint"""
     return {"message": "Sport Player API is running", "version": "1.0.0"}
 
+# Hoisted out of get_players so the per-request work is two dict lookups:
+# the column list is static, and the ORDER BY fragments are precomputed
+# for every allowed (field, direction) pair - the lookup doubles as the
+# whitelist, so user input never reaches the SQL text
+# sport is coalesced to 'Unknown' in the projection - the DB does it in C
+# during the scan instead of a Python branch per row
+_PLAYER_COLS = "id, name, age, weight, height, COALESCE(NULLIF(sport, ''), 'Unknown') AS sport, country, position, team, source, player_url, created_at, updated_at"
+_SORT_SQL = {
+    (f, d): f"ORDER BY {f} {d.upper()}"
+    for f in ("name", "age", "country", "team", "position", "id", "sport")
+    for d in ("asc", "desc")
+}
+
 @app.get("/players", response_model=PlayerListResponse, summary="Get Players with Pagination, Search, and Filters")
-async def get_players(
+def get_players(
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Players per page"),
     search: Optional[str] = Query(None, description="Search by player name"),
@@ -668,254 +1229,281 @@ async def get_players(
     sport: Optional[str] = Query(None, description="Filter by sport"),
     min_age: Optional[int] = Query(None, ge=0, description="Minimum age"),
     max_age: Optional[int] = Query(None, ge=0, description="Maximum age"),
-    sort_by: Optional[str] = Query("name", description="Sort by field (name, age, country, team, position, sport)"),
-    sort_order: Optional[str] = Query("asc", regex="^(asc|desc)$", description="Sort order")
+    sort_by: Literal["name", "age", "country", "team", "position", "id", "sport"] = Query("name", description="Sort by field"),
+    sort_order: Literal["asc", "desc"] = Query("asc", description="Sort order"),
+    after_name: Optional[str] = Query(None, description="Keyset cursor: name of the last player on the previous page"),
+    after_id: Optional[int] = Query(None, description="Keyset cursor: id of the last player on the previous page")
 ):
-    """Get players with advanced filtering, searching, and pagination."""
+    """Get players with advanced filtering, searching, and pagination.
+
+    Pass both after_name and after_id (from the last row of the previous
+    page) to page with a keyset cursor instead of OFFSET; this forces
+    ordering by (name, id)."""
     try:
-        conn = get_db_connection()
-        cur = conn.cursor()
+        with db_cursor(RealDictCursor) as cur:
         
-        where_conditions = []
-        params = []
+            where_conditions = []
+            params = []
         
-        if search:
-            where_conditions.append("name ILIKE %s")
-            params.append(f"%{search}%")
+            if search:
+                where_conditions.append("name ILIKE %s")
+                params.append(f"%{search}%")
         
-        if country:
-            where_conditions.append("country = %s")
-            params.append(country)
+            if country:
+                where_conditions.append("country = %s")
+                params.append(country)
         
-        if team:
-            where_conditions.append("team = %s")
-            params.append(team)
+            if team:
+                where_conditions.append("team = %s")
+                params.append(team)
         
-        if position:
-            where_conditions.append("position = %s")
-            params.append(position)
+            if position:
+                where_conditions.append("position = %s")
+                params.append(position)
         
-        if source:
-            where_conditions.append("source = %s")
-            params.append(source)
+            if source:
+                where_conditions.append("source = %s")
+                params.append(source)
 
-        if sport:
-            where_conditions.append("sport = %s")
-            params.append(sport)
-        
-        if min_age is not None:
-            where_conditions.append("age >= %s")
-            params.append(min_age)
-        
-        if max_age is not None:
-            where_conditions.append("age <= %s")
-            params.append(max_age)
-        
-        where_clause = ""
-        if where_conditions:
-            where_clause = "WHERE " + " AND ".join(where_conditions)
+            if sport:
+                where_conditions.append("sport = %s")
+                params.append(sport)
         
-        valid_sort_fields = ["name", "age", "country", "team", "position", "id", "sport"]
-        if sort_by not in valid_sort_fields:
-            sort_by = "name"
+            if min_age is not None:
+                where_conditions.append("age >= %s")
+                params.append(min_age)
         
-        count_query = f"SELECT COUNT(*) FROM players {where_clause}"
-        cur.execute(count_query, params)
-        total_count = cur.fetchone()[0]
+            if max_age is not None:
+                where_conditions.append("age <= %s")
+                params.append(max_age)
         
-        total_pages = math.ceil(total_count / per_page)
-        offset = (page - 1) * per_page
+            where_clause = ""
+            if where_conditions:
+                where_clause = "WHERE " + " AND ".join(where_conditions)
         
-        query = f"""
-            SELECT id, name, age, weight, height, sport, country, position, team, source, player_url, created_at, updated_at
-            FROM players 
-            {where_clause}
-            ORDER BY {sort_by} {sort_order.upper()}
-            LIMIT %s OFFSET %s
-        """
+            # Values are validated to the Literal at the request boundary, so
+            # the lookup can't miss
+            order_by = _SORT_SQL[(sort_by, sort_order)]
+
+
+            if after_name is not None and after_id is not None:
+                # Keyset pagination: seek past the previous page's last (name, id)
+                # through the btree instead of scanning and discarding OFFSET rows.
+                # The count stays a separate query over the base filters - fusing
+                # it would count only the rows after the cursor.
+                count_query = f"SELECT COUNT(*) FROM players {where_clause}"
+                cur.execute(count_query, params)
+                total_count = cur.fetchone()['count']
+                where_conditions.append("(name, id) > (%s, %s)")
+                params.extend([after_name, after_id])
+                where_clause = "WHERE " + " AND ".join(where_conditions)
+                query = f"""
+                    SELECT {_PLAYER_COLS}
+                    FROM players
+                    {where_clause}
+                    ORDER BY name, id
+                    LIMIT %s
+                """
+                cur.execute(query, params + [per_page])
+                players_data = cur.fetchall()
+            else:
+                # COUNT(*) OVER() rides along on the page query, so the filter
+                # scan runs once instead of twice (count query + page query)
+                offset = (page - 1) * per_page
+                query = f"""
+                    SELECT {_PLAYER_COLS},
+                           COUNT(*) OVER() AS total_count
+                    FROM players
+                    {where_clause}
+                    {order_by}
+                    LIMIT %s OFFSET %s
+                """
+                cur.execute(query, params + [per_page, offset])
+                players_data = cur.fetchall()
+                if players_data:
+                    total_count = players_data[0]['total_count']
+                elif page > 1:
+                    # Past-the-end page: the window count only rides along on
+                    # returned rows, so fall back to a standalone count rather
+                    # than reporting total_count=0 for a non-empty result set
+                    cur.execute(f"SELECT COUNT(*) FROM players {where_clause}", params)
+                    total_count = cur.fetchone()['count']
+                else:
+                    total_count = 0
+
+            # Ceiling division in integer arithmetic - no float round-trip
+            total_pages = -(-total_count // per_page)
+
+            for row in players_data:
+                row.pop('total_count', None)
+            # DB rows match the schema by construction; model_construct skips
+            # the 13-field validator pass, and the comprehension builds the
+            # list in one allocation without per-row append dispatch
+            players = [Player.model_construct(**row) for row in players_data]
         
-        cur.execute(query, params + [per_page, offset])
-        players_data = cur.fetchall()
-        
-        players = []
-        for row in players_data:
-            player = Player(
-                id=row[0],
-                name=row[1],
-                age=row[2],
-                weight=row[3],
-                height=row[4],
-                sport=row[5] if row[5] else "Unknown", # Return "Unknown" for NULL sports
-                country=row[6],
-                position=row[7],
-                team=row[8],
-                source=row[9],
-                player_url=row[10],
-                created_at=row[11],
-                updated_at=row[12]
+            # Server-built from trusted values - construct without validation,
+            # like the Player rows above
+            response = PlayerListResponse.model_construct(
+                players=players,
+                total_count=total_count,
+                page=page,
+                per_page=per_page,
+                total_pages=total_pages,
+                has_next=page * per_page < total_count,
+                has_prev=page > 1
             )
-            players.append(player)
-        
-        response = PlayerListResponse(
-            players=players,
-            total_count=total_count,
-            page=page,
-            per_page=per_page,
-            total_pages=total_pages,
-            has_next=page < total_pages,
-            has_prev=page > 1
-        )
         
-        return response
+            return response
         
     except psycopg2.Error as e:
         logger.error(f"Database error in get_players: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Database error")
-    finally:
-        if 'cur' in locals():
-            cur.close()
-        if 'conn' in locals():
-            conn.close()
 
 @app.get("/players/{player_id}", response_model=Player, summary="Get Player by ID")
-async def get_player(player_id: int):
+def get_player(player_id: int):
     """Get a specific player by their ID"""
     try:
-        conn = get_db_connection()
-        cur = conn.cursor()
-        
-        cur.execute("""
-            SELECT id, name, age, weight, height, sport, country, position, team, source, player_url, created_at, updated_at
-            FROM players WHERE id = %s
-        """, (player_id,))
-        
-        player_data = cur.fetchone()
-        if not player_data:
-            raise HTTPException(status_code=404, detail="Player not found")
-        
-        player = Player(
-            id=player_data[0],
-            name=player_data[1],
-            age=player_data[2],
-            weight=player_data[3],
-            height=player_data[4],
-            sport=player_data[5] if player_data[5] else "Unknown", # Return "Unknown" for NULL sports
-            country=player_data[6],
-            position=player_data[7],
-            team=player_data[8],
-            source=player_data[9],
-            player_url=player_data[10],
-            created_at=player_data[11],
-            updated_at=player_data[12]
-        )
-        
-        return player
+        with db_cursor(RealDictCursor) as cur:
+
+            execute_prepared(cur, 'player_by_id', (player_id,))
+
+            player_data = cur.fetchone()
+            if not player_data:
+                raise HTTPException(status_code=404, detail="Player not found")
+
+            # Trusted DB row - skip the validator pass (sport coalescing
+            # happens in the SQL projection)
+            return Player.model_construct(**player_data)
         
     except psycopg2.Error as e:
         logger.error(f"Database error in get_player: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Database error")
-    finally:
-        if 'cur' in locals():
-            cur.close()
-        if 'conn' in locals():
-            conn.close()
+
+# /filter-options runs five DISTINCT scans over players; the result only
+# changes as scraping progresses, so serve it from memory for a minute
+_API_CACHE_TTL = 60  # seconds, shared by /filter-options and /stats
+_filter_options_cache = {'value': None, 'expires': 0.0}
+_filter_options_lock = threading.Lock()
+
+# All five dropdown columns in one statement - five serial DISTINCT
+# queries each paid their own round-trip and filter scan
+_FILTER_OPTIONS_SQL = """
+    SELECT DISTINCT 'sports' AS kind, sport AS val FROM players WHERE sport IS NOT NULL AND sport != ''
+    UNION ALL
+    SELECT DISTINCT 'countries', country FROM players WHERE country IS NOT NULL AND country != ''
+    UNION ALL
+    SELECT DISTINCT 'teams', team FROM players WHERE team IS NOT NULL AND team != ''
+    UNION ALL
+    SELECT DISTINCT 'positions', position FROM players WHERE position IS NOT NULL AND position != ''
+    UNION ALL
+    SELECT DISTINCT 'sources', source FROM players WHERE source IS NOT NULL AND source != ''
+    ORDER BY 1, 2
+"""
 
 @app.get("/filter-options", response_model=FilterOptions, summary="Get Filter Options")
-async def get_filter_options():
+def get_filter_options():
     """Get available filter options for countries, teams, positions, sports, and sources"""
+    with _filter_options_lock:
+        if _filter_options_cache['value'] is not None and time.monotonic() < _filter_options_cache['expires']:
+            return _filter_options_cache['value']
     try:
-        conn = get_db_connection()
-        cur = conn.cursor()
-
-        cur.execute("SELECT DISTINCT sport FROM players WHERE sport IS NOT NULL AND sport != '' ORDER BY sport")
-        sports = [row[0] for row in cur.fetchall()]
+        with db_cursor() as cur:
 
-        cur.execute("SELECT DISTINCT country FROM players WHERE country IS NOT NULL AND country != '' ORDER BY country")
-        countries = [row[0] for row in cur.fetchall()]
+            buckets = {'sports': [], 'countries': [], 'teams': [], 'positions': [], 'sources': []}
+            cur.execute(_FILTER_OPTIONS_SQL)
+            for kind, val in cur.fetchall():
+                buckets[kind].append(val)
 
-        cur.execute("SELECT DISTINCT team FROM players WHERE team IS NOT NULL AND team != '' ORDER BY team")
-        teams = [row[0] for row in cur.fetchall()]
-
-        cur.execute("SELECT DISTINCT position FROM players WHERE position IS NOT NULL AND position != '' ORDER BY position")
-        positions = [row[0] for row in cur.fetchall()]
-
-        cur.execute("SELECT DISTINCT source FROM players WHERE source IS NOT NULL AND source != '' ORDER BY source")
-        sources = [row[0] for row in cur.fetchall()]
-
-        return FilterOptions(
-            sports=sports,
-            countries=countries,
-            teams=teams,
-            positions=positions,
-            sources=sources
-        )
+            options = FilterOptions.model_construct(**buckets)
+            with _filter_options_lock:
+                _filter_options_cache['value'] = options
+                _filter_options_cache['expires'] = time.monotonic() + _API_CACHE_TTL
+            return options
 
     except psycopg2.Error as e:
         logger.error(f"Database error in get_filter_options: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Database error")
 
-    finally:
-        if 'cur' in locals():
-            cur.close()
-        if 'conn' in locals():
-            conn.close()
+
+# Same caching scheme as /filter-options: the aggregates only move when
+# the scraper writes, so don't re-scan players on every request
+_stats_cache = {'value': None, 'expires': 0.0}
+_stats_lock = threading.Lock()
+
+# Live fallback when the players_stats view is absent - one statement
+# returning the same row shape as the view, with the top-10 list built
+# as json server-side
+_STATS_LIVE_SQL = """
+    SELECT
+        (SELECT COUNT(*) FROM players) AS total_players,
+        (SELECT COUNT(DISTINCT country) FROM players WHERE country IS NOT NULL) AS total_countries,
+        (SELECT COUNT(DISTINCT team) FROM players WHERE team IS NOT NULL) AS total_teams,
+        (SELECT COUNT(DISTINCT position) FROM players WHERE position IS NOT NULL) AS total_positions,
+        (SELECT AVG(age) FROM players WHERE age IS NOT NULL) AS average_age,
+        (SELECT COALESCE(json_agg(t), '[]'::json) FROM (
+            SELECT country, COUNT(*) AS count
+            FROM players
+            WHERE country IS NOT NULL
+            GROUP BY country
+            ORDER BY count DESC
+            LIMIT 10
+        ) t) AS top_countries
+"""
+
+def invalidate_api_caches():
+    """Drop the /filter-options and /stats caches (called when a scrape
+    run finishes or is stopped, so fresh data shows up immediately)."""
+    with _filter_options_lock:
+        _filter_options_cache['value'] = None
+    with _stats_lock:
+        _stats_cache['value'] = None
 
 @app.get("/stats", summary="Get Database Statistics")
-async def get_stats():
+def get_stats():
     """Get database statistics like total players, countries, teams, etc."""
+    with _stats_lock:
+        if _stats_cache['value'] is not None and time.monotonic() < _stats_cache['expires']:
+            return _stats_cache['value']
     try:
-        conn = get_db_connection()
-        cur = conn.cursor()
-        
-        # Total players
-        cur.execute("SELECT COUNT(*) FROM players")
-        total_players = cur.fetchone()[0]
-        
-        # Total countries
-        cur.execute("SELECT COUNT(DISTINCT country) FROM players WHERE country IS NOT NULL")
-        total_countries = cur.fetchone()[0]
-        
-        # Total teams
-        cur.execute("SELECT COUNT(DISTINCT team) FROM players WHERE team IS NOT NULL")
-        total_teams = cur.fetchone()[0]
-        
-        # Total positions
-        cur.execute("SELECT COUNT(DISTINCT position) FROM players WHERE position IS NOT NULL")
-        total_positions = cur.fetchone()[0]
-        
-        # Average age
-        cur.execute("SELECT AVG(age) FROM players WHERE age IS NOT NULL")
-        avg_age = cur.fetchone()[0]
-        avg_age = round(float(avg_age), 1) if avg_age else 0
-        
-        # Players by country (top 10)
-        cur.execute("""
-            SELECT country, COUNT(*) as count 
-            FROM players 
-            WHERE country IS NOT NULL 
-            GROUP BY country 
-            ORDER BY count DESC 
-            LIMIT 10
-        """)
-        top_countries = [{"country": row[0], "count": row[1]} for row in cur.fetchall()]
-        
-        return {
-            "total_players": total_players,
-            "total_countries": total_countries,
-            "total_teams": total_teams,
-            "total_positions": total_positions,
-            "average_age": avg_age,
-            "top_countries": top_countries
-        }
-        
+        with db_cursor() as cur:
+
+            # Fast path: one row from the materialized view, refreshed per
+            # scrape run. Fall back to live aggregates if the view is missing.
+            try:
+                cur.execute("""
+                    SELECT total_players, total_countries, total_teams, total_positions, average_age, top_countries
+                    FROM players_stats
+                """)
+                row = cur.fetchone()
+            except psycopg2.Error:
+                cur.connection.rollback()
+                row = None
+
+            if row is None:
+                # Same aggregates computed live, but in one statement and
+                # one round-trip instead of six serial queries
+                cur.execute(_STATS_LIVE_SQL)
+                row = cur.fetchone()
+
+            total_players, total_countries, total_teams, total_positions, avg_age, top_countries = row
+            avg_age = round(float(avg_age), 1) if avg_age else 0
+
+            stats = {
+                "total_players": total_players,
+                "total_countries": total_countries,
+                "total_teams": total_teams,
+                "total_positions": total_positions,
+                "average_age": avg_age,
+                "top_countries": top_countries
+            }
+            with _stats_lock:
+                _stats_cache['value'] = stats
+                _stats_cache['expires'] = time.monotonic() + _API_CACHE_TTL
+            return stats
+
     except psycopg2.Error as e:
         logger.error(f"Database error in get_stats: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Database error")
-    finally:
-        if 'cur' in locals():
-            cur.close()
-        if 'conn' in locals():
-            conn.close()
 
 @app.post("/start-scraping", summary="Start Scraping Process")
 async def start_scraping(background_tasks: BackgroundTasks):
@@ -938,47 +1526,70 @@ async def stop_scraping():
         raise HTTPException(status_code=400, detail="No scraping process is currently running")
     
     scraping_status['is_running'] = False
-    
+    invalidate_api_caches()
+    _notify_status_change()
+
     return {"message": "Scraping process stopped"}
 
 @app.get("/scraping-status", response_model=ScrapingStatus, summary="Get Scraping Status")
 async def get_scraping_status():
     """Get the current status of the scraping process"""
-    return ScrapingStatus(**scraping_status)
+    with _status_lock:
+        snapshot = {**scraping_status, 'errors': list(scraping_status['errors'])}
+    return ScrapingStatus.model_construct(**snapshot)
+
+@app.get("/scraping-status/stream", summary="Stream Scraping Status (SSE)")
+async def stream_scraping_status():
+    """Server-sent events stream of scraping status changes.
+
+    Push-based alternative to polling /scraping-status: an event is sent
+    only when the status actually changes (checked at most once a second,
+    immediately on major transitions), so a 1Hz dashboard poll no longer
+    pays a full request/response per tick. The generator is async, so a
+    quiet stream parks on the event loop instead of pinning one of the
+    ~40 request-threadpool threads per connected client."""
+    loop = asyncio.get_running_loop()
+    changed = asyncio.Event()
+    subscriber = (loop, changed)
+
+    async def gen():
+        with _status_subscribers_lock:
+            _status_subscribers.add(subscriber)
+        try:
+            last = None
+            while True:
+                with _status_lock:
+                    snapshot = {**scraping_status, 'errors': list(scraping_status['errors'])}
+                if snapshot != last:
+                    last = snapshot
+                    yield "data: " + json.dumps(snapshot, default=str) + "\n\n"
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    pass
+                changed.clear()
+        finally:
+            with _status_subscribers_lock:
+                _status_subscribers.discard(subscriber)
+    return StreamingResponse(gen(), media_type="text/event-stream")
+
+_LOG_COLS = ('id', 'error_message', 'player_url', 'timestamp')
 
 @app.get("/logs", summary="Get Error Logs")
-async def get_logs(limit: int = Query(100, ge=1, le=1000, description="Number of logs to retrieve")):
+def get_logs(limit: int = Query(100, ge=1, le=1000, description="Number of logs to retrieve")):
     """Get recent error logs from the database"""
     try:
-        conn = get_db_connection()
-        cur = conn.cursor()
+        with db_cursor() as cur:
         
-        cur.execute("""
-            SELECT id, error_message, player_url, timestamp
-            FROM rugby_logs
-            ORDER BY timestamp DESC
-            LIMIT %s
-        """, (limit,))
-        
-        logs = []
-        for row in cur.fetchall():
-            logs.append({
-                "id": row[0],
-                "error_message": row[1],
-                "player_url": row[2],
-                "timestamp": row[3]
-            })
-        
-        return {"logs": logs}
+            execute_prepared(cur, 'recent_logs', (limit,))
+
+            logs = [dict(zip(_LOG_COLS, row)) for row in cur.fetchall()]
+
+            return {"logs": logs}
         
     except psycopg2.Error as e:
         logger.error(f"Database error in get_logs: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Database error")
-    finally:
-        if 'cur' in locals():
-            cur.close()
-        if 'conn' in locals():
-            conn.close()
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,11 +1,21 @@
 import os
 import json
 import time
+
+try:
+    import orjson
+except ImportError:  # pinned in requirements.txt, but don't hard-require it
+    orjson = None
 import urllib.parse
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import List, Dict
-from common_utils import insert_player, log_error # Assuming common_utils has insert_player and log_error
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from common_utils import insert_players, get_known_player_urls, log_error
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
@@ -13,35 +23,128 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+from rugbypass import get_chromedriver_path, make_session, fetch_page
+
+# Teams are independent of each other, so they can be crawled concurrently
+# with one Chrome instance per worker thread
+_ULTIMATE_WORKERS = 4
+
+# Compiled once - these run for every player scraped
+_ORD_RE = re.compile(r'(\d+)(?:st|nd|rd|th)')     # "23rd Apr 2008" -> "23 Apr 2008"
+_HW_RE = re.compile(r'(\d+(?:\.\d+)?)m/(?:(\d+)?(?:kg)?)?')  # "1.88m/95kg"
+_SAFE_RE = re.compile(r'[^a-zA-Z0-9_]')           # filename sanitizer
+
+# Cheap shape check so malformed DOB strings never reach the parse +
+# exception path ("23rd Apr 2008" with or without the ordinal suffix)
+_QUICK_DOB_RE = re.compile(r'\d{1,2}(?:st|nd|rd|th)?\s+[A-Za-z]{3}\s+\d{4}')
+
+_MONTHS = {m: i for i, m in enumerate(
+    ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'], 1)}
+
+
+def _parse_dob(s):
+    """Parse '23 Apr 2008' into a datetime without strptime's per-call
+    format machinery. Raises KeyError/ValueError on malformed input."""
+    day, month, year = s.split()
+    return datetime(int(year), _MONTHS[month], int(day))
 
 
 class UltimateRugbyPlayerScraper:
-    def __init__(self, base_url="https://www.ultimaterugby.com/team", output_dir="ultimate_rugby_data", delay=2):
+    def __init__(self, base_url="https://www.ultimaterugby.com/team", output_dir="ultimate_rugby_data", delay=2, debug=False):
         """
         Initialize the Ultimate Rugby Player scraper
-        
+
         Args:
             base_url (str): The base URL to scrape (default: https://www.ultimaterugby.com/team)
             output_dir (str): Directory to save scraped data
             delay (int): Delay between requests in seconds
+            debug (bool): Dump page sources to disk for inspection
         """
         self.base_url = base_url
         self.output_dir = output_dir
         self.delay = delay
+        self.debug = debug
         self.scraped_players = set()
-        self.all_player_data = []
+
+        # Drivers are per-thread so teams can be crawled in parallel; every
+        # driver ever created is tracked so close() can quit them all
+        self._local = threading.local()
+        self._drivers = []
+        self._drivers_lock = threading.Lock()
+        self._data_lock = threading.Lock()
 
         # Create output directories
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
 
+        # Resume support: bio URLs already scraped in earlier runs are loaded
+        # from a sidecar file so driver.get is never repeated for them
+        self._scraped_path = os.path.join(output_dir, 'scraped_players.txt')
+        try:
+            with open(self._scraped_path, encoding='utf-8') as f:
+                self.scraped_players = set(filter(None, f.read().splitlines()))
+            print(f"Resuming with {len(self.scraped_players)} previously scraped player bios")
+        except FileNotFoundError:
+            pass
+        self._scraped_fp = open(self._scraped_path, 'a', encoding='utf-8', buffering=1)
+
+        # Players stream to a JSON-lines file as they are scraped instead of
+        # accumulating in memory for one big end-of-run dump
+        self._jsonl_path = os.path.join(output_dir, 'all_players.jsonl')
+        self._jsonl_fp = open(self._jsonl_path, 'ab')
+        self._players_written = 0
+
+        # Pooled keep-alive HTTP session; bio pages are server-rendered so
+        # most of them never need the browser at all. The adapter sizes the
+        # pool for the worker threads and retries transient failures with
+        # backoff instead of surfacing them as scrape errors.
+        self.session = make_session()
+        adapter = HTTPAdapter(
+            pool_connections=8, pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=(429, 500, 502, 503, 504)))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # Filled at scrape start with URLs already in the database
+        self._known_urls = frozenset()
+
+        # No driver yet: the property creates one lazily on first use, so a
+        # caller passing shared_driver never pays for a throwaway Chrome
+        # launch, and HTTP-only runs may never start a browser at all
+
+    @property
+    def driver(self):
+        d = getattr(self._local, 'driver', None)
+        if d is None:
+            d = self._create_driver()
+            self.driver = d
+        return d
+
+    @driver.setter
+    def driver(self, d):
+        self._local.driver = d
+        if d is not None:
+            with self._drivers_lock:
+                if d not in self._drivers:
+                    self._drivers.append(d)
+
+    def _create_driver(self):
+        """Build a Chrome instance for the calling thread."""
         # Setup Selenium WebDriver with improved options for better stability
         chrome_options = Options()
-        
-        # Comment out headless mode for debugging - uncomment after testing
-        # chrome_options.add_argument("--headless")
-        
+
+        # Return from driver.get() at DOMContentLoaded instead of waiting for
+        # every sub-resource; the explicit waits cover late-rendered elements
+        chrome_options.page_load_strategy = 'eager'
+
+        # Headless: no compositor or window means far less CPU and RSS per
+        # worker; the other scrapers here run headless too
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_argument("--js-flags=--max-old-space-size=256")
+
         # Basic stability options
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
@@ -93,17 +196,34 @@ class UltimateRugbyPlayerScraper:
 
         # Initialize WebDriver with better error handling
         try:
-            self.driver = webdriver.Chrome(
-                service=Service(ChromeDriverManager().install()),
+            driver = webdriver.Chrome(
+                service=Service(get_chromedriver_path()),
                 options=chrome_options
             )
             # Increase timeouts for better stability
-            self.driver.set_page_load_timeout(60)  # Increased from 30
-            self.driver.implicitly_wait(15)  # Increased from 10
-            
+            driver.set_page_load_timeout(60)  # Increased from 30
+            # No implicit wait: it compounds with every find_element miss on
+            # optional elements. Readiness is handled by explicit WebDriverWaits.
+            driver.implicitly_wait(0)
+
             # Execute script to avoid detection
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            
+            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+
+            # Block heavy resource classes and trackers at the protocol level;
+            # the prefs above only cover images
+            try:
+                driver.execute_cdp_cmd('Network.enable', {})
+                driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': [
+                    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg',
+                    '*.woff', '*.woff2', '*.ttf', '*.css',
+                    '*googletagmanager*', '*google-analytics*',
+                    '*doubleclick*', '*facebook.net*',
+                ]})
+            except WebDriverException as e:
+                print(f"Could not set up CDP resource blocking: {e}")
+
+            return driver
+
         except Exception as e:
             print(f"Error initializing WebDriver: {e}")
             raise
@@ -111,34 +231,68 @@ class UltimateRugbyPlayerScraper:
     def wait_and_click(self, element, timeout=10):
         """Wait for element to be clickable and click it"""
         try:
-            WebDriverWait(self.driver, timeout).until(
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
                 EC.element_to_be_clickable(element)
             )
             self.driver.execute_script("arguments[0].click();", element)
-            time.sleep(self.delay)
             return True
         except Exception as e:
             print(f"Error clicking element: {e}")
             return False
 
+    def _extract_teams(self, page_source):
+        """Pull team name/url pairs out of listing-page HTML."""
+        teams = []
+        seen_urls = set()
+        soup = BeautifulSoup(page_source, 'html.parser')
+        team_links = soup.select('a[href*="/team/"], a[href*="/teams/"]')
+        print(f"Found {len(team_links)} team links on main page")
+
+        for link in team_links:
+            team_url = urllib.parse.urljoin(self.base_url, link['href'])
+            team_name = link.get_text(strip=True)
+
+            if (team_url and team_name and
+                len(team_name) > 1 and
+                team_url not in seen_urls):
+
+                seen_urls.add(team_url)
+                teams.append({
+                    "name": team_name,
+                    "url": team_url
+                })
+                print(f"Found team: {team_name}")
+
+        return teams
+
     def get_teams_from_main_page(self):
         """Extract all team links from the main page with retry mechanism"""
         print("Loading main page...")
-        
+
+        # The listing markup is static, so try a plain HTTP fetch before
+        # paying for a browser navigation
+        html_text = fetch_page(self.session, self.base_url)
+        if html_text:
+            teams = self._extract_teams(html_text)
+            if teams:
+                print(f"Total teams found: {len(teams)} (HTTP)")
+                return teams
+            print("HTTP fetch returned no teams, falling back to Selenium...")
+
         # Retry mechanism for loading the page
         max_retries = 3
         for attempt in range(max_retries):
             try:
                 print(f"Attempt {attempt + 1} to load main page...")
                 self.driver.get(self.base_url)
-                
-                # Wait longer for initial page load
-                WebDriverWait(self.driver, 30).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
+
+                # Wait for the team links themselves rather than sleeping a
+                # fixed amount after <body> appears
+                WebDriverWait(self.driver, 30, poll_frequency=0.1).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "a[href*='/team/']"))
                 )
-                
+
                 print(f"Page loaded successfully. Title: {self.driver.title}")
-                time.sleep(5)
                 break
                 
             except Exception as e:
@@ -149,120 +303,32 @@ class UltimateRugbyPlayerScraper:
                 print("Retrying in 10 seconds...")
                 time.sleep(10)
 
-        teams = []
-        
         try:
             print("Main page loaded, searching for teams...")
-            
+
+            # Grab the rendered page once and parse locally — one WebDriver
+            # round-trip instead of hundreds of find_elements calls.
+            page_source = self.driver.page_source
+
             # Debug: Save page source for inspection
-            try:
-                with open(os.path.join(self.output_dir, "main_page_debug.html"), 'w', encoding='utf-8') as f:
-                    f.write(self.driver.page_source)
-                print("Main page source saved for debugging")
-            except Exception as e:
-                print(f"Could not save debug page: {e}")
-            
-            # Strategy 1: Look for team containers in tables
-            try:
-                tables = self.driver.find_elements(By.TAG_NAME, "table")
-                print(f"Found {len(tables)} tables on main page")
-                
-                for table in tables:
-                    rows = table.find_elements(By.TAG_NAME, "tr")
-                    for row in rows:
-                        cells = row.find_elements(By.TAG_NAME, "td")
-                        for cell in cells:
-                            # Look for div.row elements
-                            row_divs = cell.find_elements(By.CSS_SELECTOR, "div.row")
-                            for row_div in row_divs:
-                                # Look for team links: div > a
-                                team_links = row_div.find_elements(By.CSS_SELECTOR, "div a")
-                                for link in team_links:
-                                    try:
-                                        team_url = link.get_attribute("href")
-                                        team_name = link.text.strip()
-                                        
-                                        if (team_url and team_name and 
-                                            len(team_name) > 1 and
-                                            '/team/' in team_url and
-                                            not any(t["url"] == team_url for t in teams)):
-                                            
-                                            teams.append({
-                                                "name": team_name,
-                                                "url": team_url
-                                            })
-                                            print(f"Found team: {team_name}")
-                                            
-                                    except Exception as e:
-                                        continue
-            except Exception as e:
-                print(f"Error with table strategy: {e}")
-            
-            # Strategy 2: Look for all div.row elements anywhere on page
-            if not teams:
+            if self.debug:
                 try:
-                    print("Trying direct div.row search...")
-                    row_divs = self.driver.find_elements(By.CSS_SELECTOR, "div.row")
-                    print(f"Found {len(row_divs)} div.row elements")
-                    
-                    for row_div in row_divs:
-                        team_links = row_div.find_elements(By.CSS_SELECTOR, "div a, a")
-                        for link in team_links:
-                            try:
-                                team_url = link.get_attribute("href")
-                                team_name = link.text.strip()
-                                
-                                if (team_url and team_name and 
-                                    len(team_name) > 1 and
-                                    ('/team/' in team_url or 'ultimaterugby.com' in team_url) and
-                                    not any(t["url"] == team_url for t in teams)):
-                                    
-                                    teams.append({
-                                        "name": team_name,
-                                        "url": team_url
-                                    })
-                                    print(f"Found team: {team_name}")
-                                    
-                            except Exception as e:
-                                continue
+                    with open(os.path.join(self.output_dir, "main_page_debug.html"), 'w', encoding='utf-8') as f:
+                        f.write(page_source)
+                    print("Main page source saved for debugging")
                 except Exception as e:
-                    print(f"Error with div.row strategy: {e}")
-            
-            # Strategy 3: Look for any team-related links
-            if not teams:
-                print("Trying general link search...")
-                all_links = self.driver.find_elements(By.TAG_NAME, "a")
-                print(f"Found {len(all_links)} total links")
-                
-                for link in all_links:
-                    try:
-                        href = link.get_attribute("href")
-                        text = link.text.strip()
-                        
-                        if (href and text and 
-                            ('/team/' in href or '/teams/' in href) and 
-                            len(text) > 2 and
-                            not any(t["url"] == href for t in teams)):
-                            
-                            teams.append({
-                                "name": text,
-                                "url": href
-                            })
-                            print(f"Found team: {text}")
-                            
-                    except Exception as e:
-                        continue
-            
+                    print(f"Could not save debug page: {e}")
+
+            teams = self._extract_teams(page_source)
             print(f"Total teams found: {len(teams)}")
             
             # If still no teams found, print some debug info
-            if not teams:
+            if not teams and self.debug:
                 print("DEBUG: No teams found. Checking page content...")
                 print(f"Current URL: {self.driver.current_url}")
                 print(f"Page title: {self.driver.title}")
-                
+
                 # Print first 1000 characters of page source
-                page_source = self.driver.page_source
                 print(f"Page source preview: {page_source[:1000]}...")
             
             return teams
@@ -275,14 +341,13 @@ class UltimateRugbyPlayerScraper:
         """Navigate to team page and click on squad navigation"""
         print(f"Loading team page: {team_url}")
         self.driver.get(team_url)
-        time.sleep(5)
 
         try:
-            # Wait for the page to load
-            WebDriverWait(self.driver, 20).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
+            # Wait for the secondary navigation we need instead of a blanket sleep
+            WebDriverWait(self.driver, 20, poll_frequency=0.1).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "nav.navbar-secondary ul.page-nav li a"))
             )
-            
+
             print("Team page loaded, looking for squad navigation...")
             
             # Find the squad navigation: nav.navbar-secondary > ul.page-nav > li (2nd element)
@@ -300,9 +365,11 @@ class UltimateRugbyPlayerScraper:
                     
                     print(f"Clicking on squad navigation: {squad_link.text}")
                     self.wait_and_click(squad_link)
-                    
-                    # Wait for squad page to load
-                    time.sleep(5)
+
+                    # Wait for the squad cards to render
+                    WebDriverWait(self.driver, 20, poll_frequency=0.1).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, "div.flipper"))
+                    )
                     return True
                 else:
                     print("Not enough navigation items found")
@@ -323,45 +390,41 @@ class UltimateRugbyPlayerScraper:
         players = []
         
         try:
-            # Wait for squad page to load
-            WebDriverWait(self.driver, 20).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
+            # Wait for the player cards, not just <body>
+            WebDriverWait(self.driver, 20, poll_frequency=0.1).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "div.flipper div.front h4"))
             )
-            
-            # Find all flipper elements: div.flipper
-            flipper_elements = self.driver.find_elements(By.CSS_SELECTOR, "div.flipper")
-            print(f"Found {len(flipper_elements)} flipper elements")
-            
-            for i, flipper in enumerate(flipper_elements):
-                try:
-                    player_data = {}
-                    
-                    # Get player name from front: div.front > h4
-                    try:
-                        front_div = flipper.find_element(By.CSS_SELECTOR, "div.front")
-                        player_name_elem = front_div.find_element(By.TAG_NAME, "h4")
-                        player_data["name"] = player_name_elem.text.strip()
-                        print(f"Found player: {player_data['name']}")
-                    except Exception as e:
-                        print(f"Could not find player name in flipper {i}: {e}")
+
+            # Collect every flipper card in one browser-side pass — a single
+            # WebDriver round-trip instead of several per player. Two flat
+            # string arrays serialize cheaper than a list of objects, and
+            # getElementsByClassName beats querySelectorAll for a bare class.
+            names, urls = self.driver.execute_script("""
+                const flips = document.getElementsByClassName('flipper');
+                const n = [], u = [];
+                for (const f of flips) {
+                    const h = f.getElementsByTagName('h4')[0];
+                    const a = f.getElementsByTagName('a')[0];
+                    if (!h) continue;
+                    n.push(h.textContent.trim());
+                    u.push(a ? a.href : null);
+                }
+                return [n, u];
+            """) or ([], [])
+            raw_players = [{'name': n, 'bio_url': u} for n, u in zip(names, urls) if n]
+            print(f"Found {len(raw_players)} flipper elements")
+
+            seen_bio_urls = set()
+            for player_data in raw_players:
+                print(f"Found player: {player_data['name']}")
+                if player_data["bio_url"]:
+                    if player_data["bio_url"] in seen_bio_urls:
                         continue
-                    
-                    # Get bio link from back: div.back > a
-                    try:
-                        back_div = flipper.find_element(By.CSS_SELECTOR, "div.back")
-                        bio_link_elem = back_div.find_element(By.TAG_NAME, "a")
-                        player_data["bio_url"] = bio_link_elem.get_attribute("href")
-                        print(f"Found bio URL for {player_data['name']}: {player_data['bio_url']}")
-                    except Exception as e:
-                        print(f"Could not find bio link for {player_data['name']}: {e}")
-                        player_data["bio_url"] = None
-                    
-                    if player_data["name"]:
-                        players.append(player_data)
-                        
-                except Exception as e:
-                    print(f"Error processing flipper element {i}: {e}")
-                    continue
+                    seen_bio_urls.add(player_data["bio_url"])
+                    print(f"Found bio URL for {player_data['name']}: {player_data['bio_url']}")
+                else:
+                    print(f"Could not find bio link for {player_data['name']}")
+                players.append(player_data)
             
             print(f"Total players found: {len(players)}")
             return players
@@ -370,6 +433,29 @@ class UltimateRugbyPlayerScraper:
             print(f"Error getting players from squad page: {e}")
             return []
 
+    def _fetch_bio_http(self, bio_url):
+        """Fetch and parse a bio page over plain HTTP.
+
+        Returns the same {full_name, spans, paras} dict the Selenium snapshot
+        produces, or None if the fetch failed or the profile markup is absent
+        (in which case the caller falls back to the browser).
+        """
+        html_text = fetch_page(self.session, bio_url)
+        if not html_text:
+            return None
+        soup = BeautifulSoup(html_text, 'html.parser')
+        profile_div = soup.select_one('div.profile-detail')
+        if profile_div is None:
+            return None
+        h1 = profile_div.find('h1')
+        return {
+            'full_name': h1.get_text(strip=True) if h1 else None,
+            'spans': [t for t in (s.get_text(strip=True)
+                                  for s in profile_div.select('div.detail span')) if t],
+            'paras': [t for t in (p.get_text(strip=True)
+                                  for p in profile_div.find_all('p')) if t],
+        }
+
     def scrape_player_bio(self, player_data):
         """Scrape individual player bio details"""
         if not player_data.get("bio_url"):
@@ -383,67 +469,62 @@ class UltimateRugbyPlayerScraper:
             return player_data
             
         print(f"Scraping player bio: {player_data['name']} - {bio_url}")
-        self.driver.get(bio_url)
-        time.sleep(3)
 
         try:
-            # Wait for the profile page to load
-            WebDriverWait(self.driver, 15).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            
-            # Extract profile details: div.profile-detail
-            try:
-                profile_detail = self.driver.find_element(By.CSS_SELECTOR, "div.profile-detail")
-                
-                # Extract name from h1
-                try:
-                    name_elem = profile_detail.find_element(By.TAG_NAME, "h1")
-                    player_data["full_name"] = name_elem.text.strip()
+            # HTTP first: a pooled keep-alive fetch plus a local parse beats a
+            # browser navigation by an order of magnitude for these
+            # server-rendered pages
+            profile = self._fetch_bio_http(bio_url)
+
+            if profile is None:
+                # Fall back to the browser for pages the plain fetch can't serve
+                self.driver.get(bio_url)
+
+                # Wait for the profile block we actually read
+                WebDriverWait(self.driver, 15, poll_frequency=0.1).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.profile-detail h1"))
+                )
+
+                # Snapshot the whole profile-detail block in one script call
+                # instead of six-plus find_element round-trips
+                profile = self.driver.execute_script("""
+                    const d = document.querySelector('div.profile-detail');
+                    if (!d) return null;
+                    const h1 = d.querySelector('h1');
+                    const spans = Array.from(d.querySelectorAll('div.detail span'))
+                        .map(s => s.innerText.trim()).filter(t => t);
+                    const paras = Array.from(d.querySelectorAll('p'))
+                        .map(p => p.innerText.trim()).filter(t => t);
+                    return {full_name: h1 ? h1.innerText.trim() : null,
+                            spans: spans, paras: paras};
+                """)
+
+            if profile:
+                if profile["full_name"]:
+                    player_data["full_name"] = profile["full_name"]
                     print(f"Full name: {player_data['full_name']}")
-                except Exception as e:
-                    print(f"Could not find full name: {e}")
-                
-                # Extract details from div.detail > span
-                try:
-                    detail_div = profile_detail.find_element(By.CSS_SELECTOR, "div.detail")
-                    detail_spans = detail_div.find_elements(By.TAG_NAME, "span")
-                    
-                    player_data["details"] = {}
-                    for span in detail_spans:
-                        span_text = span.text.strip()
-                        if span_text and ':' in span_text:
-                            key, value = span_text.split(':', 1)
-                            player_data["details"][key.strip()] = value.strip()
-                        elif span_text:
-                            player_data["details"][f"info_{len(player_data['details'])}"] = span_text
-                    
-                    print(f"Details extracted: {len(player_data['details'])} fields")
-                    
-                except Exception as e:
-                    print(f"Could not find detail spans: {e}")
-                
-                # Extract other details from p elements
-                try:
-                    p_elements = profile_detail.find_elements(By.TAG_NAME, "p")
-                    player_data["additional_info"] = []
-                    
-                    for p in p_elements:
-                        p_text = p.text.strip()
-                        if p_text:
-                            player_data["additional_info"].append(p_text)
-                    
-                    print(f"Additional info: {len(player_data['additional_info'])} paragraphs")
-                    
-                except Exception as e:
-                    print(f"Could not find p elements: {e}")
-                    
-            except Exception as e:
-                print(f"Could not find profile-detail div: {e}")
+                else:
+                    print("Could not find full name")
+
+                player_data["details"] = {}
+                for span_text in profile["spans"]:
+                    if ':' in span_text:
+                        key, value = span_text.split(':', 1)
+                        player_data["details"][key.strip()] = value.strip()
+                    else:
+                        player_data["details"][f"info_{len(player_data['details'])}"] = span_text
+                print(f"Details extracted: {len(player_data['details'])} fields")
+
+                player_data["additional_info"] = profile["paras"]
+                print(f"Additional info: {len(player_data['additional_info'])} paragraphs")
+            else:
+                print("Could not find profile-detail div")
             
             # Add timestamp
             player_data["scraped_at"] = time.strftime("%Y-%m-%d %H:%M:%S")
-            self.scraped_players.add(bio_url)
+            with self._data_lock:
+                self.scraped_players.add(bio_url)
+                self._scraped_fp.write(bio_url + '\n')
             
             return player_data
             
@@ -454,15 +535,27 @@ class UltimateRugbyPlayerScraper:
     def save_data(self, data, filename):
         """Save data to JSON file"""
         filepath = os.path.join(self.output_dir, filename)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
+        if orjson is not None:
+            # orjson emits bytes directly, skipping the slow pure-Python
+            # indent path in the stdlib encoder
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'), ensure_ascii=False)
         print(f"Data saved to: {filepath}")
 
     def scrape_all_ultimate_rugby_data(self):
         """Main method to scrape all Ultimate Rugby player data"""
         try:
             print("Starting Ultimate Rugby data scraping...")
-            
+
+            # Players already in the database are skipped outright, so
+            # incremental runs only pay for new bios
+            self._known_urls = frozenset(get_known_player_urls('ultimaterugby.com'))
+            if self._known_urls:
+                print(f"Skipping {len(self._known_urls)} players already in the database")
+
             # Step 1: Get all teams
             teams = self.get_teams_from_main_page()
             if not teams:
@@ -471,165 +564,195 @@ class UltimateRugbyPlayerScraper:
             
             self.save_data(teams, "teams_list.json")
             
-            # Step 2: Process each team
-            for i, team in enumerate(teams, 1):
-                print(f"\n--- Processing team {i}/{len(teams)}: {team['name']} ---")
-                
-                try:
-                    # Navigate to squad page
-                    if not self.navigate_to_squad_page(team['url']):
-                        print(f"Could not navigate to squad page for team: {team['name']}")
-                        continue
-                    
-                    # Get players from squad page
-                    players = self.get_players_from_squad_page()
-                    
-                    if not players:
-                        print(f"No players found for team: {team['name']}")
-                        continue
-                    
-                    # Step 3: Process each player's bio
-                    team_player_data = []
-                    for j, player in enumerate(players, 1):
-                        print(f"\n  Processing player {j}/{len(players)}: {player['name']}")
-                        
-                        try:
-                            # Add team information
-                            player['team'] = team['name']
-                            player['team_url'] = team['url']
-                            
-                            # Scrape player bio
-                            player_with_bio = self.scrape_player_bio(player)
-                            
-                            team_player_data.append(player_with_bio)
-                            self.all_player_data.append(player_with_bio)
-                            
-                            # --- Start: Extract and map data for DB insertion ---
-                            name = player_with_bio.get("full_name") or player_with_bio.get("name")
-                            team_name = player_with_bio.get("team")
-                            player_url = player_with_bio.get("bio_url")
-
-                            # Defaults
-                            age = None
-                            height = None
-                            weight = None
-                            position = None
-                            country = None # Ultimate Rugby does not consistently provide country on player bio page
-
-                            details = player_with_bio.get("details", {})
-
-                            # Parse Age from 'info_0' (Date of Birth)
-                            dob_str = details.get('info_0')
-                            if dob_str:
-                                try:
-                                    # Ensure the date format matches the scraped data, e.g., "23rd Apr 2008" or "6th Apr 2008"
-                                    # The example JSON uses "DDth Mon YYYY" or "DD Mon YYYY"
-                                    # We need to handle the "th", "st", "nd", "rd" suffixes if they appear.
-                                    # Simpler approach: remove "st", "nd", "rd", "th" before parsing.
-                                    dob_str_cleaned = re.sub(r'(\d+)(st|nd|rd|th)', r'\1', dob_str)
-                                    dob = datetime.strptime(dob_str_cleaned, "%d %b %Y")
-                                    today = datetime.today()
-                                    age = today.year - dob.year - ((today.month, today.day) < (dob.month, dob.day))
-                                except ValueError:
-                                    print(f"Could not parse DOB for {name}: {dob_str}")
-                                    pass # Age remains None
-
-                            # Parse Height and Weight from 'info_1'
-                            height_weight_str = details.get('info_1')
-                            if height_weight_str:
-                                # Regex to find patterns like "1.88m/95kg" or "1.88m/95" or "0.00m/kg"
-                                # Capture height (group 1) and optional weight (group 4)
-                                match = re.match(r'(\d+(\.\d+)?)m/(?:(\d+)?(?:kg)?)?', height_weight_str.strip())
-                                if match:
-                                    try:
-                                        meters = float(match.group(1))
-                                        total_inches = round(meters * 39.3701)
-                                        feet = total_inches // 12
-                                        inches = total_inches % 12
-                                        
-                                        # Set height to None if it's "0'0""
-                                        if feet == 0 and inches == 0:
-                                            height = None
-                                        else:
-                                            height = f"{feet}'{inches}\""
-
-                                        weight_val = match.group(3) # Group 3 captures the number before optional 'kg'
-                                        if weight_val: # Only set weight if a numerical value was captured
-                                            try:
-                                                # Attempt conversion to int to ensure it's a valid number
-                                                weight_int = int(weight_val)
-                                                if weight_int > 0: # Only consider positive weights
-                                                    weight = str(weight_int) # Store as string as per schema
-                                                else:
-                                                    weight = None # Handle 0 or negative weights as None
-                                            except ValueError:
-                                                weight = None # Not a valid number
-                                        else:
-                                            weight = None # No numerical weight captured
-                                    except ValueError:
-                                        print(f"Could not parse height/weight for {name}: {height_weight_str}") # Debug print
-                                        pass # Height/Weight remain None
-
-                            # Parse Position from 'info_2'
-                            position_str = details.get('info_2')
-                            if position_str:
-                                position = position_str.strip()
-
-
-                            db_data = {
-                                "name": name,
-                                "age": age,
-                                "weight": weight,
-                                "height": height,
-                                "sport": "Rugby", # Explicitly set sport for Ultimate Rugby
-                                "country": country, # Will remain None as it's not scraped
-                                "position": position,
-                                "team": team_name,
-                                "source": "ultimaterugby.com",
-                                "player_url": player_url,
-                            }
-                            # --- End: Extract and map data for DB insertion ---
-
-                            # Save directly to DB
-                            # from scraper_api import scraping_status  # So you can update counts
-                            # Ensure insert_player is correctly imported or defined within this context
-                            # For local testing, ensure common_utils has insert_player
-                            if insert_player(db_data):
-                                # If you have a global scraping_status accessible here:
-                                # scraping_status['processed'] += 1
-                                pass # Placeholder if scraping_status is not directly available
-
-                        except Exception as e:
-                            print(f"Error processing player {player['name']}: {e}")
-                            log_error(f"Error processing player {player['name']}: {e}", player.get('bio_url'))
-                            continue
-                    
-                    # Save team data
-                    if team_player_data:
-                        team_filename = f"team_{re.sub(r'[^a-zA-Z0-9_]', '_', team['name'])}.json"
-                        self.save_data(team_player_data, team_filename)
-                    
-                except Exception as e:
-                    print(f"Error processing team {team['name']}: {e}")
-                    log_error(f"Error processing team {team['name']}: {e}", team.get('url'))
-                    continue
-            
-            # Final save
-            self.save_data(self.all_player_data, "all_players_final.json")
-            print(f"\n=== Scraping completed! Total players scraped: {len(self.all_player_data)} ===")
-            
+            # Step 2: Process teams in parallel; each worker thread lazily
+            # creates its own Chrome instance via the driver property
+            with ThreadPoolExecutor(max_workers=_ULTIMATE_WORKERS) as executor:
+                futures = {
+                    executor.submit(self.process_team, team, i, len(teams)): team
+                    for i, team in enumerate(teams, 1)
+                }
+                for future in as_completed(futures):
+                    team = futures[future]
+                    try:
+                        future.result()
+                    except Exception as e:
+                        print(f"Error processing team {team['name']}: {e}")
+                        log_error(f"Error processing team {team['name']}: {e}", team.get('url'))
+
+            # Players were streamed to all_players.jsonl as they were scraped
+            print(f"\n=== Scraping completed! Total players scraped: {self._players_written} ===")
+
         except Exception as e:
             print(f"Critical error in main scraping process: {e}")
             log_error(f"Critical error in Ultimate Rugby main scraping process: {e}")
         finally:
             self.close()
 
+    def process_team(self, team, index, total):
+        """Scrape one team's squad and player bios; runs on a worker thread."""
+        print(f"\n--- Processing team {index}/{total}: {team['name']} ---")
+
+        # Navigate to squad page
+        if not self.navigate_to_squad_page(team['url']):
+            print(f"Could not navigate to squad page for team: {team['name']}")
+            return
+
+        # Get players from squad page
+        players = self.get_players_from_squad_page()
+
+        if not players:
+            print(f"No players found for team: {team['name']}")
+            return
+
+        # Process each player's bio
+        team_player_data = []
+        db_rows = []
+        today = datetime.today()  # hoisted; ages only need day resolution
+        _today_y, _today_md = today.year, (today.month, today.day)
+        for j, player in enumerate(players, 1):
+            # Known players need no bio fetch, no parse and no upsert
+            if player.get('bio_url') and player['bio_url'] in self._known_urls:
+                print(f"  Player already in database, skipping: {player['name']}")
+                continue
+
+            print(f"\n  Processing player {j}/{len(players)}: {player['name']}")
+
+            try:
+                # Add team information
+                player['team'] = team['name']
+                player['team_url'] = team['url']
+
+                # Scrape player bio
+                player_with_bio = self.scrape_player_bio(player)
+
+                team_player_data.append(player_with_bio)
+
+                # --- Start: Extract and map data for DB insertion ---
+                name = player_with_bio.get("full_name") or player_with_bio.get("name")
+                team_name = player_with_bio.get("team")
+                player_url = player_with_bio.get("bio_url")
+
+                # Defaults
+                age = None
+                height = None
+                weight = None
+                position = None
+                country = None # Ultimate Rugby does not consistently provide country on player bio page
+
+                details = player_with_bio.get("details", {})
+
+                # Parse Age from 'info_0' (Date of Birth)
+                dob_str = details.get('info_0')
+                if dob_str and _QUICK_DOB_RE.match(dob_str):
+                    try:
+                        # Ensure the date format matches the scraped data, e.g., "23rd Apr 2008" or "6th Apr 2008"
+                        # The example JSON uses "DDth Mon YYYY" or "DD Mon YYYY"
+                        # We need to handle the "th", "st", "nd", "rd" suffixes if they appear.
+                        # Simpler approach: remove "st", "nd", "rd", "th" before parsing.
+                        dob_str_cleaned = _ORD_RE.sub(r'\1', dob_str)
+                        dob = _parse_dob(dob_str_cleaned)
+                        age = _today_y - dob.year
+                        if _today_md < (dob.month, dob.day):
+                            age -= 1
+                    except (KeyError, ValueError):
+                        print(f"Could not parse DOB for {name}: {dob_str}")
+                        pass # Age remains None
+
+                # Parse Height and Weight from 'info_1'
+                height_weight_str = details.get('info_1')
+                if height_weight_str and height_weight_str.lstrip()[:1].isdigit():
+                    # Matches patterns like "1.88m/95kg" or "1.88m/95" or "0.00m/kg"
+                    # Capture height (group 1) and optional weight (group 2)
+                    match = _HW_RE.match(height_weight_str.strip())
+                    if match:
+                        try:
+                            meters = float(match.group(1))
+                            total_inches = round(meters * 39.3701)
+                            feet = total_inches // 12
+                            inches = total_inches % 12
+
+                            # Set height to None if it's "0'0""
+                            if feet == 0 and inches == 0:
+                                height = None
+                            else:
+                                height = f"{feet}'{inches}\""
+
+                            weight_val = match.group(2) # Group 2 captures the number before optional 'kg'
+                            if weight_val: # Only set weight if a numerical value was captured
+                                try:
+                                    # Attempt conversion to int to ensure it's a valid number
+                                    weight_int = int(weight_val)
+                                    if weight_int > 0: # Only consider positive weights
+                                        weight = str(weight_int) # Store as string as per schema
+                                    else:
+                                        weight = None # Handle 0 or negative weights as None
+                                except ValueError:
+                                    weight = None # Not a valid number
+                            else:
+                                weight = None # No numerical weight captured
+                        except ValueError:
+                            print(f"Could not parse height/weight for {name}: {height_weight_str}") # Debug print
+                            pass # Height/Weight remain None
+
+                # Parse Position from 'info_2'
+                position_str = details.get('info_2')
+                if position_str:
+                    position = position_str.strip()
+
+
+                db_data = {
+                    "name": name,
+                    "age": age,
+                    "weight": weight,
+                    "height": height,
+                    "sport": "Rugby", # Explicitly set sport for Ultimate Rugby
+                    "country": country, # Will remain None as it's not scraped
+                    "position": position,
+                    "team": team_name,
+                    "source": "ultimaterugby.com",
+                    "player_url": player_url,
+                }
+                # --- End: Extract and map data for DB insertion ---
+
+                # Collected for one batched insert after the team loop
+                db_rows.append(db_data)
+
+                # Stash the parsed fields with the record so the return-shaping
+                # pass never has to redo the DOB/height parsing, then stream it
+                player_with_bio["parsed"] = db_data
+                if orjson is not None:
+                    line = orjson.dumps(player_with_bio)
+                else:
+                    line = json.dumps(player_with_bio, ensure_ascii=False).encode('utf-8')
+                with self._data_lock:
+                    self._jsonl_fp.write(line + b'\n')
+                    self._players_written += 1
+
+            except Exception as e:
+                print(f"Error processing player {player['name']}: {e}")
+                log_error(f"Error processing player {player['name']}: {e}", player.get('bio_url'))
+                continue
+
+        # One transaction per team instead of one commit per player
+        if db_rows:
+            inserted = insert_players(db_rows)
+            print(f"Inserted {inserted} players for team: {team['name']}")
+
+        # Save team data
+        if team_player_data:
+            team_filename = f"team_{_SAFE_RE.sub('_', team['name'])}.json"
+            self.save_data(team_player_data, team_filename)
+
+        # Single politeness pause between teams; per-page waits are
+        # condition-based now
+        time.sleep(self.delay)
+
     def test_connection(self):
         """Test if we can connect to the website"""
         print("Testing connection to Ultimate Rugby website...")
         try:
             self.driver.get(self.base_url)
-            WebDriverWait(self.driver, 30).until(
+            WebDriverWait(self.driver, 30, poll_frequency=0.1).until(
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
             print(f"✓ Successfully connected to: {self.driver.current_url}")
@@ -640,9 +763,20 @@ class UltimateRugbyPlayerScraper:
             return False
 
     def close(self):
-        """Close the WebDriver"""
-        if self.driver:
-            self.driver.quit()
+        """Close every WebDriver created across worker threads"""
+        if not self._scraped_fp.closed:
+            self._scraped_fp.close()
+        if not self._jsonl_fp.closed:
+            self._jsonl_fp.close()
+        self.session.close()
+        with self._drivers_lock:
+            drivers, self._drivers = self._drivers, []
+        self._local.driver = None
+        for driver in drivers:
+            try:
+                driver.quit()
+            except WebDriverException as e:
+                print(f"Error closing driver: {e}")
 
 
 def main():
@@ -661,10 +795,100 @@ def main():
         print("Connection test failed. Please check your internet connection and try again.")
         scraper.close()
 
-def scrape_ultimate_rugby_players(shared_driver=None) -> List[Dict]:
+def _shape(player, today_y, today_md):
+    """Map one raw scraped record to the standard players-table dict."""
+    # Records written since the crawl started stashing its parse results
+    # carry the finished dict already; older jsonl lines fall through to
+    # the re-parse below
+    parsed = player.get("parsed")
+    if parsed:
+        return dict(parsed)
+
+    name = player.get("full_name") or player.get("name")
+    team = player.get("team")
+    player_url = player.get("bio_url")
+
+    age = None
+    height = None
+    weight = None
+    country = None # Country will remain None unless specifically scraped or inferred
+
+    details = player.get("details", {})
+
+    # Parse Age
+    dob_str = details.get('info_0')
+    if dob_str and _QUICK_DOB_RE.match(dob_str):
+        try:
+            dob_str_cleaned = _ORD_RE.sub(r'\1', dob_str)
+            dob = _parse_dob(dob_str_cleaned)
+            age = today_y - dob.year
+            if today_md < (dob.month, dob.day):
+                age -= 1
+        except (KeyError, ValueError):
+            pass
+
+    # Parse Height and Weight
+    height_weight_str = details.get('info_1')
+    if height_weight_str and height_weight_str.lstrip()[:1].isdigit():
+        match = _HW_RE.match(height_weight_str.strip())
+        if match:
+            try:
+                meters = float(match.group(1))
+                total_inches = round(meters * 39.3701)
+                feet = total_inches // 12
+                inches = total_inches % 12
+
+                if feet == 0 and inches == 0:
+                    height = None
+                else:
+                    height = f"{feet}'{inches}\""
+
+                weight_val = match.group(2)
+                if weight_val:
+                    weight = weight_val
+            except ValueError:
+                pass
+
+    # Parse Position
+    position = details.get("info_2")
+
+    return {
+        "name": name,
+        "age": age,
+        "weight": weight,
+        "height": height,
+        "sport": "Rugby",
+        "country": country,
+        "position": position,
+        "team": team,
+        "source": "ultimaterugby.com",
+        "player_url": player_url,
+    }
+
+def iter_ultimate_rugby_players(jsonl_path=os.path.join("ultimate_rugby_data", "all_players.jsonl")):
+    """Yield standard-format player dicts from a crawl's JSON-lines stream.
+
+    Only one raw record and one shaped dict are live at a time, so iterating
+    a large crawl stays at constant memory.
     """
-    Public interface to run the scraper and return player dicts in standard format.
+    today = datetime.today()
+    today_y, today_md = today.year, (today.month, today.day)
+    loads = orjson.loads if orjson is not None else json.loads
+    try:
+        with open(jsonl_path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield _shape(loads(line), today_y, today_md)
+    except FileNotFoundError:
+        return
+
+def scrape_ultimate_rugby_players(shared_driver=None, return_records=False) -> List[Dict]:
+    """
+    Public interface to run the scraper.
     If shared_driver is passed, it will use that Selenium instance.
+    DB insertion happens inside scrape_all_ultimate_rugby_data; pass
+    return_records=True to also get the shaped player dicts back, otherwise
+    the reshape pass is skipped entirely and [] is returned.
     """
     scraper = UltimateRugbyPlayerScraper()
     if shared_driver:
@@ -676,102 +900,16 @@ def scrape_ultimate_rugby_players(shared_driver=None) -> List[Dict]:
     # Call the main scraping logic which now includes DB insertion
     scraper.scrape_all_ultimate_rugby_data()
 
-    # The loop below becomes redundant if scrape_all_ultimate_rugby_data already inserts to DB.
-    # If the intent of `scrape_ultimate_rugby_players` is only to return the list,
-    # then the `insert_player` calls inside `scrape_all_ultimate_rugby_data`
-    # would still happen. If the goal is to *only* insert players here,
-    # then remove the `insert_player` calls from `scrape_all_ultimate_rugby_data`
-    # and retain this loop.
-    # For now, let's assume `scrape_all_ultimate_rugby_data` is the primary inserter.
-    # You might want to refine if `scrape_ultimate_rugby_players` is used elsewhere
-    # to simply return data without DB interaction.
-
-    # This loop is currently redundant if scraping_status and insert_player are managed
-    # within scrape_all_ultimate_rugby_data.
-    # If `scrape_ultimate_rugby_players` is meant to *only* format and return,
-    # then the DB insertion should NOT be in scrape_all_ultimate_rugby_data.
-    # For now, I'm assuming `scrape_all_ultimate_rugby_data` is the canonical
-    # place for DB insertion for Ultimate Rugby players.
-    final_player_data_for_return = []
-    for player in scraper.all_player_data:
-        name = player.get("full_name") or player.get("name")
-        team = player.get("team")
-        player_url = player.get("bio_url")
-
-        age = None
-        height = None
-        weight = None
-        position = None
-        country = None # Country will remain None unless specifically scraped or inferred
-
-        details = player.get("details", {})
-
-        # Re-parse or just use the already parsed values from player_with_bio if they were stored there.
-        # It's better to process once and store thoroughly.
-        # Given the provided structure, re-parsing from `details` for `return` consistency:
-        
-        # Parse Age
-        dob_str = details.get('info_0')
-        if dob_str:
-            try:
-                dob_str_cleaned = re.sub(r'(\d+)(st|nd|rd|th)', r'\1', dob_str)
-                dob = datetime.strptime(dob_str_cleaned, "%d %b %Y")
-                today = datetime.today()
-                age = today.year - dob.year - ((today.month, today.day) < (dob.month, dob.day))
-            except ValueError:
-                pass
+    if not return_records:
+        scraper.close()
+        return []
 
-        # Parse Height and Weight
-        height_weight_str = details.get('info_1')
-        if height_weight_str:
-            match = re.match(r'(\d+(\.\d+)?)m/((\d+)?kg)?', height_weight_str.replace("kg", "").strip())
-            if match:
-                try:
-                    meters = float(match.group(1))
-                    total_inches = round(meters * 39.3701)
-                    feet = total_inches // 12
-                    inches = total_inches % 12
-                    
-                    if feet == 0 and inches == 0:
-                        height = None
-                    else:
-                        height = f"{feet}'{inches}\""
-
-                    weight_val = match.group(4) if match.group(4) else None
-                    if weight_val == '':
-                        weight = None
-                    elif weight_val:
-                        weight = weight_val
-                except ValueError:
-                    pass
-        
-        # Parse Position
-        position = details.get("info_2")
-
-        data = {
-            "name": name,
-            "age": age,
-            "weight": weight,
-            "height": height,
-            "sport": "Rugby",
-            "country": country,
-            "position": position,
-            "team": team,
-            "source": "ultimaterugby.com",
-            "player_url": player_url,
-        }
-        final_player_data_for_return.append(data)
-        
-        # The `insert_player` call here is redundant if `scrape_all_ultimate_rugby_data`
-        # is already doing it and this function is primarily called by `scraper_api.py`
-        # where `scrape_all_ultimate_rugby_data` is used to trigger insertions.
-        # Keeping it commented to avoid duplicate insertions if scrape_all_ultimate_rugby_data inserts.
-        # from scraper_api import scraping_status # To update counts
-        # if insert_player(data):
-        #    scraping_status['processed'] += 1
+    # Players were streamed to all_players.jsonl during the crawl; shape them
+    # one record at a time rather than holding two copies of the crawl
+    final_player_data_for_return = list(iter_ultimate_rugby_players(scraper._jsonl_path))
 
     scraper.close()
-    return final_player_data_for_return # This ensures the function returns formatted data
+    return final_player_data_for_return
 
 if __name__ == '__main__':
         main()
\ No newline at end of file